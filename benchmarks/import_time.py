@@ -0,0 +1,96 @@
+"""
+Cost of the consts fallback tables (locations, weather codes, wind directions): written as dict literals in a module,
+like consts.py used to have them and every import paid for, against loading them from data/fallback_tables.json.gz
+on first fallback use.
+weatheril.consts is imported on its own, without the package __init__ and with its dependencies already imported,
+so the lazy and the forced load rows differ by the cost of the tables only.
+
+    python benchmarks/import_time.py
+
+Every import runs in a fresh interpreter, after a first run that writes the .pyc files.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from weatheril import consts  # noqa: E402
+
+ROUNDS = 15
+
+# Registers weatheril as a bare package, so importing weatheril.consts does not run the package __init__
+CONSTS_SETUP = """
+import gzip, os, threading, types
+import pytz
+package = types.ModuleType("weatheril")
+package.__path__ = [os.path.join({root!r}, "weatheril")]
+sys.modules["weatheril"] = package
+import weatheril.json_backend
+""".format(root=ROOT)
+
+MEASURE = """
+import sys, time, tracemalloc
+sys.path[:0] = {paths!r}
+{setup}
+if {memory}:
+    tracemalloc.start()
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def run(paths: list, setup: str, statement: str, memory: bool) -> tuple:
+    code = MEASURE.format(paths=paths, setup=setup, statement=statement, memory=memory)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    elapsed, allocated = output.split()
+    return float(elapsed), int(allocated)
+
+
+def measure(paths: list, setup: str, statement: str) -> tuple:
+    """
+    Best time of statement (without tracing) and the memory it allocates, each run in a fresh interpreter
+    """
+    run(paths, setup, statement, False)
+    elapsed = min(run(paths, setup, statement, False)[0] for _ in range(ROUNDS))
+    return elapsed, run(paths, setup, statement, True)[1]
+
+
+def write_literal_module(directory: str) -> str:
+    path = os.path.join(directory, "literal_tables.py")
+    with open(path, "w", encoding="utf-8") as f:
+        for name in consts.FALLBACK_TABLES:
+            f.write(name + " = " + repr(getattr(consts, name)) + "\n\n")
+    return "literal_tables"
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        literal_module = write_literal_module(directory)
+        results = {
+            # What every import of weatheril paid when consts.py held the tables
+            "tables as dict literals, at import": measure([directory], "", "import " + literal_module),
+            "consts, tables from the resource (lazy)": measure([ROOT], CONSTS_SETUP, "import weatheril.consts"),
+            # The same import with the tables loaded right away, as if consts still paid for them at import
+            "consts, tables loaded at import": measure(
+                [ROOT], CONSTS_SETUP, "import weatheril.consts; weatheril.consts.EN_LOCATIONS"
+            ),
+            # Paid once, and only by processes that fall back to the tables
+            "tables from the resource, first use": measure(
+                [ROOT], "from weatheril import consts", "consts.HE_LOCATIONS"
+            ),
+        }
+    print("%-40s %12s %14s" % ("fallback tables", "time", "memory"))
+    for name, (elapsed, memory) in results.items():
+        print("%-40s %10.2fms %12.1fKB" % (name, elapsed * 1e3, memory / 1024))
+    lazy, loaded = results["consts, tables from the resource (lazy)"], results["consts, tables loaded at import"]
+    print("%-40s %10.2fms %12.1fKB" % ("saved at import by the lazy tables", (loaded[0] - lazy[0]) * 1e3,
+                                       (loaded[1] - lazy[1]) / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare the installed json backends decoding IMS payloads.
+
+Record payloads once with RecordingTransport, e.g.:
+    >>> set_transport(RecordingTransport("recordings"))
+    >>> WeatherIL(21, "he").get_forecast()
+then run:
+    python benchmarks/json_backends.py recordings
+Without a directory, synthetic forecast and locations_info sized payloads are used.
+"""
+import glob
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from weatheril.json_backend import JSON_BACKENDS  # noqa: E402
+
+ROUNDS = 5
+
+
+def recorded_payloads(directory: str) -> dict:
+    payloads = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.body"))):
+        with open(path, "rb") as f:
+            body = f.read()
+        if body[:1] in (b"{", b"["):
+            payloads[os.path.basename(path)[:-len(".body")]] = body
+    return payloads
+
+
+def synthetic_payloads() -> dict:
+    hours = {
+        "%02d:00" % hour: {
+            "forecast_time": "2024-01-01 %02d:00:00" % hour,
+            "created": "2024-01-01 06:00:00",
+            "weather_code": "1220",
+            "temperature": "18",
+            "relative_humidity": "60",
+            "wind_direction_id": "2",
+            "wind_speed": "12",
+            "rain_chance": "10",
+        }
+        for hour in range(24)
+    }
+    forecast = {"data": {"2024-01-%02d" % day: {"daily": {"lid": "21"}, "hourly": hours} for day in range(1, 8)}}
+    locations = {
+        "data": {
+            str(lid): {"lid": str(lid), "name": "מיקום " + str(lid), "lat": "31.7", "lon": "35.2", "rid": "118"}
+            for lid in range(1, 300)
+        }
+    }
+    return {
+        "full_forecast_data (synthetic)": json.dumps(forecast, ensure_ascii=False).encode(),
+        "locations_info (synthetic)": json.dumps(locations, ensure_ascii=False).encode(),
+    }
+
+
+def main():
+    payloads = recorded_payloads(sys.argv[1]) if len(sys.argv) > 1 else synthetic_payloads()
+    if not payloads:
+        sys.exit("No json recordings found")
+
+    print("%-40s %10s" % ("payload", "bytes") + "".join("%14s" % name for name in JSON_BACKENDS) + "%14s" % "json(text)")
+    for name, body in payloads.items():
+        number = max(1, 2_000_000 // len(body))
+        timings = [
+            min(timeit.repeat(lambda: loads(body), number=number, repeat=ROUNDS)) / number
+            for loads in JSON_BACKENDS.values()
+        ]
+        # What fetch_data used to do: decode the body to str, then parse it with the stdlib
+        timings.append(min(timeit.repeat(lambda: json.loads(body.decode("utf-8")), number=number, repeat=ROUNDS)) / number)
+        print("%-40s %10d" % (name[:40], len(body)) + "".join("%12.1fus" % (timing * 1e6) for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
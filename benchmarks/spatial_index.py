@@ -0,0 +1,68 @@
+"""
+Nearest location and radius queries: linear haversine scan over every location against the LocationIndex KD-tree.
+Uses the Hebrew fallback locations table, no network needed.
+
+    python benchmarks/spatial_index.py [points]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from weatheril import consts  # noqa: E402
+from weatheril.spatial import EARTH_RADIUS_KM, LocationIndex  # noqa: E402
+
+RADIUS_KM = 10
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def scan_nearest(locations: list, lat: float, lon: float):
+    return min(locations, key=lambda location: haversine_km(lat, lon, float(location["lat"]), float(location["lon"])))
+
+
+def scan_within(locations: list, lat: float, lon: float, radius_km: float) -> list:
+    return [
+        location for location in locations
+        if haversine_km(lat, lon, float(location["lat"]), float(location["lon"])) <= radius_km
+    ]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    random.seed(0)
+    points = [(random.uniform(29.5, 33.3), random.uniform(34.3, 35.9)) for _ in range(count)]
+    start = time.perf_counter()
+    index = LocationIndex(consts.HE_LOCATIONS)
+    build = time.perf_counter() - start
+    locations = index.locations
+
+    print("%d locations, index built in %.2fms, %d points" % (len(index), build * 1e3, count))
+    print("%-28s %12s %12s" % ("", "scan", "index"))
+    nearest = (
+        timed(lambda: [scan_nearest(locations, lat, lon) for lat, lon in points]),
+        timed(lambda: [index.nearest(lat, lon) for lat, lon in points]),
+    )
+    within = (
+        timed(lambda: [scan_within(locations, lat, lon, RADIUS_KM) for lat, lon in points]),
+        timed(lambda: [index.within(lat, lon, RADIUS_KM) for lat, lon in points]),
+    )
+    for name, (scan, indexed) in (("nearest", nearest), ("within %dkm" % RADIUS_KM, within)):
+        print("%-28s %10.1fus %10.1fus" % (name + " per point", scan / count * 1e6, indexed / count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
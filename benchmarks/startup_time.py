@@ -0,0 +1,65 @@
+"""
+Startup check: `from weatheril import WeatherIL` and `from weatheril import *` in a fresh interpreter must not import
+Pillow, aiohttp, the stand-in server or the radar animation machinery, nor load the fallback tables and the timezone.
+Prints the best import time of each over a few runs, and exits with 1 when something heavy is imported
+or a time is over the budget.
+
+    python benchmarks/startup_time.py [budget_ms]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+ROUNDS = 7
+# Modules that must stay out of a plain WeatherIL startup
+HEAVY_MODULES = ("PIL", "PIL.Image", "aiohttp", "http.server", "weatheril.aio", "weatheril.standin", "weatheril.redis_standin")
+# weatheril.consts attributes that must not be loaded yet
+LAZY_CONSTS = ("HE_LOCATIONS", "EN_LOCATIONS", "HE_WEATHER_CODES", "TIMEZONE")
+
+MEASURE = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+import weatheril.consts
+imported = [name for name in {heavy!r} if name in sys.modules]
+loaded = [name for name in {lazy!r} if name in vars(weatheril.consts)]
+print(elapsed, ",".join(imported + loaded))
+"""
+
+
+# The imports checked, the second one is what the README examples use
+STATEMENTS = ("from weatheril import WeatherIL", "from weatheril import *")
+
+
+def measure(statement: str) -> tuple:
+    code = MEASURE.format(root=ROOT, statement=statement, heavy=HEAVY_MODULES, lazy=LAZY_CONSTS)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    elapsed, loaded = output.split(" ")
+    return float(elapsed), [name for name in loaded.strip().split(",") if name]
+
+
+def main():
+    budget = float(sys.argv[1]) / 1e3 if len(sys.argv) > 1 else None
+    failed = False
+    for statement in STATEMENTS:
+        measure(statement)
+        runs = [measure(statement) for _ in range(ROUNDS)]
+        elapsed = min(run[0] for run in runs)
+        loaded = sorted({name for run in runs for name in run[1]})
+
+        print("%s: %.1fms" % (statement, elapsed * 1e3))
+        if loaded:
+            print("    Loaded at startup: " + ", ".join(loaded))
+            failed = True
+        if budget is not None and elapsed > budget:
+            print("    Over the %.1fms budget" % (budget * 1e3))
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
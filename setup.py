@@ -12,6 +12,7 @@ setup_args = dict(
     long_description=readme,
     license='MIT',
     packages=find_packages(),
+    package_data={"weatheril": ["data/*.json.gz"]},
     author='Tomer Klein',
     author_email='tomer.klein@gmail.com',
     keywords=['ims', 'weatheril', 'Israel Meteorological Service','Meteorological Service','weather'],
@@ -27,6 +28,10 @@ setup_args = dict(
                     "pytz",
                     "urllib3",
                     "loguru"],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+    },
     classifiers=[
     "Intended Audience :: Developers",
     "Topic :: Software Development :: Build Tools",
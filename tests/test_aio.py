@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from weatheril import utils  # noqa: E402
+from weatheril.aio import AsyncWeatherIL  # noqa: E402
+from weatheril.cache import clear_response_cache  # noqa: E402
+from weatheril.consts import CURRENT_ANALYSIS_URL, WARNINGS_URL  # noqa: E402
+from weatheril.resilience import (  # noqa: E402
+    DEFAULT_NEGATIVE_CACHE_EXPIRATION,
+    reset_circuit_breakers,
+    set_negative_cache_expiration,
+)
+from weatheril.transport import ReplayTransport, save_recording, set_transport  # noqa: E402
+
+ANALYSIS = {"data": {"1": {"lid": "1", "temperature": "25.5", "weather_code": "1250", "wind_direction_id": "1"}}}
+WARNINGS = {"data": {"full_warnings_data": {}}}
+
+
+@pytest.fixture(autouse=True)
+def replay_without_reference_data(tmp_path, monkeypatch):
+    """
+    IMS answers the data endpoints only, every reference data url gets a 404
+    """
+    for url, payload in ((CURRENT_ANALYSIS_URL.format(language="en", location=1), ANALYSIS),
+                         (WARNINGS_URL.format(language="en"), WARNINGS)):
+        save_recording(str(tmp_path), url, 200, {"Content-Type": "application/json"}, json.dumps(payload).encode())
+    set_transport(ReplayTransport(str(tmp_path)))
+    set_negative_cache_expiration(0)
+
+    def blocking_fetch(*args, **kwargs):
+        raise AssertionError("Blocking reference data fetch from the async client")
+
+    monkeypatch.setattr(utils, "get_cached_data", blocking_fetch)
+    utils.clear_reference_data()
+    clear_response_cache()
+    yield
+    set_transport(None)
+    set_negative_cache_expiration(DEFAULT_NEGATIVE_CACHE_EXPIRATION)
+    reset_circuit_breakers()
+    utils.clear_reference_data()
+    clear_response_cache()
+
+
+def run(coroutine_fn):
+    async def main():
+        async with AsyncWeatherIL(1, "en") as client:
+            return await coroutine_fn(client)
+    return asyncio.run(main())
+
+
+def test_missing_maps_fall_back_to_the_shipped_tables():
+    weather = run(lambda client: client.get_current_analysis())
+    assert weather is not None
+    assert weather.location == utils._fallback_reference_map("en", "locations_info")[1]["name"]
+    assert weather.description == utils._fallback_reference_map("en", "weather_codes")[1250]
+
+
+def test_missing_maps_without_fallback_raise():
+    with pytest.raises(utils.ReferenceDataError):
+        run(lambda client: client.get_warnings())
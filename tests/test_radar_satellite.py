@@ -0,0 +1,50 @@
+import pytest
+import requests
+
+from weatheril.radar_satellite import download_image
+from weatheril.resilience import (
+    DEFAULT_MAX_RETRY_BACKOFF,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    call_with_retries,
+    configure_retries,
+)
+from weatheril.transport import RecordedResponse
+
+URL = "https://ims.gov.il/sites/default/files/ims_data/map_images/IMSRadar/IMSRadar_202401010900.png"
+
+
+class StatusTransport:
+    """
+    Answers with the given status codes in turn, the last one repeated
+    """
+
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.requests = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests += 1
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return RecordedResponse(url, status, {"Content-Type": "image/png"}, b"\x89PNG" if status == 200 else b"error")
+
+
+@pytest.fixture(autouse=True)
+def fast_retries():
+    configure_retries(retries=2, backoff_in_sec=0, max_backoff_in_sec=0)
+    yield
+    configure_retries(DEFAULT_RETRIES, DEFAULT_RETRY_BACKOFF, DEFAULT_MAX_RETRY_BACKOFF)
+
+
+def test_server_errors_are_retried():
+    transport = StatusTransport(503, 200)
+    response = call_with_retries(URL, lambda: download_image(transport, URL))
+    assert response.content == b"\x89PNG"
+    assert transport.requests == 2
+
+
+def test_client_errors_raise_without_retrying():
+    transport = StatusTransport(404)
+    with pytest.raises(requests.HTTPError):
+        call_with_retries(URL, lambda: download_image(transport, URL))
+    assert transport.requests == 1
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from weatheril.cache import CacheEntry, RedisCacheBackend, RedisError, ResponseCache
+from weatheril.redis_standin import RedisStandInServer
+
+
+@pytest.fixture
+def server():
+    with RedisStandInServer() as server:
+        yield server
+
+
+@pytest.fixture
+def backend(server):
+    backend = server.backend()
+    yield backend
+    backend.close()
+
+
+def test_get_set_delete(backend):
+    assert backend.get("missing") is None
+    backend.set("key", b"value\r\n\x00", 60)
+    assert backend.get("key") == b"value\r\n\x00"
+    backend.delete("key")
+    assert backend.get("key") is None
+
+
+def test_ttl_and_expiry(backend):
+    assert backend.ttl("missing") is None
+    backend.set("key", b"value", 60)
+    assert 59 < backend.ttl("key") <= 60
+    backend.set("short", b"value", 0.05)
+    time.sleep(0.1)
+    assert backend.get("short") is None
+    assert backend.ttl("short") is None
+
+
+def test_clear_deletes_only_the_prefix(server, backend):
+    other = server.backend(prefix="other:")
+    for index in range(1200):
+        backend.set("key" + str(index), b"value", 60)
+    other.set("key", b"value", 60)
+    backend.clear()
+    assert backend.get("key0") is None and backend.get("key1199") is None
+    assert other.get("key") == b"value"
+    other.close()
+
+
+def test_databases_are_separate(server, backend):
+    other = server.backend(db=1)
+    backend.set("key", b"db0", 60)
+    other.set("key", b"db1", 60)
+    assert backend.get("key") == b"db0"
+    assert other.get("key") == b"db1"
+    other.close()
+
+
+def test_password():
+    with RedisStandInServer(password="secret") as server:
+        backend = server.backend()
+        backend.set("key", b"value", 60)
+        assert backend.get("key") == b"value"
+        backend.close()
+        host, port = server.address
+        anonymous = RedisCacheBackend(host=host, port=port)
+        with pytest.raises(RedisError):
+            anonymous.get("key")
+        anonymous.close()
+
+
+def test_reconnects_after_the_server_closes_the_connection(server, backend):
+    backend.set("key", b"value", 60)
+    backend._socket.close()
+    assert backend.get("key") == b"value"
+
+
+def test_response_cache_shared_between_processes(server):
+    writer, reader = ResponseCache(server.backend()), ResponseCache(server.backend())
+    entry = CacheEntry(data={"data": {"1": {"temperature": 25}}}, fetched_at=time.time(), etag='"abc"')
+    writer.set("https://ims.gov.il/now_analysis", entry, 60)
+    read = reader.get("https://ims.gov.il/now_analysis")
+    assert read.data == entry.data
+    assert read.etag == '"abc"'
+    # The same stored bytes give back the already decoded entry
+    assert reader.get("https://ims.gov.il/now_analysis") is read
+    writer.delete("https://ims.gov.il/now_analysis")
+    assert reader.get("https://ims.gov.il/now_analysis") is None
+
+
+def test_response_cache_clear(server):
+    cache = ResponseCache(server.backend())
+    cache.set("url", CacheEntry(data={"data": {}}, fetched_at=time.time()), 60)
+    cache.clear()
+    assert cache.get("url") is None
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from weatheril import utils
+
+URL = "https://ims.gov.il/en/now_analysis/1"
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    calls = []
+
+    def get_cached_data(url, cache_expiration_in_sec=None, stale_while_revalidate=False, max_staleness_in_sec=None):
+        calls.append((url, cache_expiration_in_sec))
+        return {"fetched": True}
+
+    monkeypatch.setattr(utils, "get_cached_data", get_cached_data)
+    return calls
+
+
+def test_get_data(fetched):
+    assert utils.get_data(URL, 60) == {"fetched": True}
+    assert fetched == [(URL, 60)]
+
+
+def test_get_data_legacy_call_keeps_fresh_data(fetched):
+    with pytest.warns(DeprecationWarning):
+        assert utils.get_data({"current": True}, URL, datetime.now(), 60) == {"current": True}
+    assert fetched == []
+
+
+def test_get_data_legacy_call_fetches_expired_data(fetched):
+    with pytest.warns(DeprecationWarning):
+        assert utils.get_data({"current": True}, URL, datetime.now() - timedelta(seconds=61), 60) == {"fetched": True}
+    with pytest.warns(DeprecationWarning):
+        assert utils.get_data({}, URL, datetime.now(), 60) == {"fetched": True}
+    assert fetched == [(URL, 60), (URL, 60)]
@@ -0,0 +1,63 @@
+import dataclasses
+
+import pytest
+
+from weatheril.parsing import parse_warnings
+from weatheril.utils import clear_reference_data, load_reference_data
+
+FULL_WARNINGS_DATA = {
+    "full_warnings_data": {
+        "2024-01-01": {
+            "r-5": {
+                "1": {
+                    "wid": "1", "alert_id": "10", "severity_id": "3", "warning_type_id": "7",
+                    "sent": "2024-01-01 08:00:00", "valid_from": "2024-01-01 09:00:00",
+                    "valid_to": "2024-01-01 18:00:00", "full_en": "Heavy heat ", "full_he": "עומס חום ",
+                    "text": "Heat", "text_full": "", "valid_from_unix": "1704092400",
+                    "groups": ["2"], "regions": ["5", "6"],
+                }
+            }
+        }
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def reference_data():
+    load_reference_data("en", "locations_info", {"1": {"lid": "1", "rid": "5", "name": "Tel Aviv"}})
+    load_reference_data("en", "regions", [{"rid": "r-5", "name": "Coast"}, {"rid": "r-6", "name": "Negev"}])
+    load_reference_data("en", "warnings_metadata", {
+        "ims_warning_type": {"7": {"warning_type_id": "7", "name": "Heat wave"}},
+        "warning_groups": {"g-2": {"name": "Heat"}},
+        "warning_severity": {"3": {"severity_id": "3", "severity_name": "Yellow"}},
+    })
+    yield
+    clear_reference_data()
+
+
+def test_parse_warnings_resolves_names():
+    warning, = parse_warnings("en", "1", FULL_WARNINGS_DATA)
+    assert warning.groups == ("Heat",)
+    assert warning.regions == ("Coast", "Negev")
+    assert warning.group_ids == ("2",)
+    assert warning.region_ids == ("5", "6")
+    assert warning.region_name == "Coast"
+    assert warning.severity == "Yellow"
+    assert warning.warning_type == "Heat wave"
+    assert warning.text_full == "Heavy heat"
+
+
+def test_replace_keeps_resolved_values():
+    warning, = parse_warnings("en", "1", FULL_WARNINGS_DATA)
+    copy = dataclasses.replace(warning, text="Extreme heat")
+    assert copy.text == "Extreme heat"
+    assert copy.groups == warning.groups
+    assert copy.regions == warning.regions
+    assert copy.sent == warning.sent
+    assert copy == dataclasses.replace(warning, text="Extreme heat")
+
+
+def test_replace_resolves_new_ids():
+    warning, = parse_warnings("en", "1", FULL_WARNINGS_DATA)
+    copy = dataclasses.replace(warning, region_ids=("6",))
+    assert copy.regions == ("Negev",)
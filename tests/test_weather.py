@@ -0,0 +1,67 @@
+import copy
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from weatheril.parsing import parse_current_analysis
+from weatheril.utils import clear_reference_data, load_reference_data
+
+ANALYSIS_DATA = {
+    "1": {
+        "lid": "1", "relative_humidity": "60", "rain": "0", "temperature": "25.5", "wind_speed": "10",
+        "wind_direction_id": "2", "weather_code": "1250", "forecast_time": "2024-01-01 09:00:00",
+        "modified": "2024-01-01 09:05:00", "extra": {"stations": [{"id": 1}]},
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def reference_data():
+    load_reference_data("en", "locations_info", {"1": {"lid": "1", "rid": "5", "name": "Tel Aviv"}})
+    load_reference_data("en", "weather_codes", {"1250": {"weather_code": "1250", "desc": "Clear"}})
+    load_reference_data("en", "wind_directions", {"2": {"direction": "360"}})
+    yield
+    clear_reference_data()
+
+
+@pytest.fixture
+def weather():
+    return parse_current_analysis("en", "1", ANALYSIS_DATA)
+
+
+def test_json_is_serializable(weather):
+    assert json.loads(json.dumps(weather.json)) == ANALYSIS_DATA["1"]
+
+
+def test_json_is_deep_read_only(weather):
+    with pytest.raises(TypeError):
+        weather.json["temperature"] = "30"
+    with pytest.raises(TypeError):
+        weather.json["extra"]["stations"] = []
+    with pytest.raises(TypeError):
+        weather.json["extra"]["stations"][0]["id"] = 2
+    assert weather.json["extra"]["stations"] == ({"id": 1},)
+
+
+def test_json_does_not_share_the_payload(weather):
+    ANALYSIS_DATA["1"]["extra"]["stations"][0]["id"] = 3
+    try:
+        assert weather.json["extra"]["stations"][0]["id"] == 1
+    finally:
+        ANALYSIS_DATA["1"]["extra"]["stations"][0]["id"] = 1
+
+
+def test_json_dict_is_a_mutable_copy(weather):
+    payload = weather.json_dict()
+    payload["extra"]["stations"].append({"id": 2})
+    assert payload["extra"]["stations"] == [{"id": 1}, {"id": 2}]
+    assert weather.json["extra"]["stations"] == ({"id": 1},)
+
+
+def test_copies(weather):
+    assert dataclasses.replace(weather, temperature=30.0).json is weather.json
+    assert copy.deepcopy(weather).json == weather.json
+    assert pickle.loads(pickle.dumps(weather)).json == weather.json
+    assert dataclasses.asdict(weather)["json"] == weather.json
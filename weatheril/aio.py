@@ -0,0 +1,528 @@
+"""Asyncio twin of WeatherIL, built on aiohttp"""
+import asyncio
+import socket
+
+from loguru import logger
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .consts import CURRENT_ANALYSIS_URL, FORECAST_URL, RADAR_SATELLITE_URL, WARNINGS_URL, DEFAULT_MAX_STALENESS
+from .parsing import parse_current_analysis, parse_forecast, parse_radar_images, parse_warnings, memoized_parse
+from .parsing import ANALYSIS_REFERENCE_DATA, FORECAST_REFERENCE_DATA, WARNINGS_REFERENCE_DATA
+from .radar_satellite import RadarSatellite
+from .cache import get_response_cache
+from .batch import DEFAULT_MAX_CONCURRENCY, _parse_batch_analysis, _parse_batch_forecast
+from .singleflight import AsyncSingleFlight
+from .utils import REFERENCE_DATA_URLS, ReferenceDataError, get_missing_reference_data, load_reference_data
+from .utils import load_fallback_reference_data
+from .utils import conditional_request_headers, cache_retention, cache_entry_from_response
+from .cache_policy import endpoint_of, entry_expiration, max_age_from_headers
+from .resilience import CircuitOpenError, get_circuit_breaker, get_negative_result, get_request_timeout, get_retries
+from .compression import ACCEPT_ENCODING, read_body, record_response, record_transfer
+from .transport import RecordingTransport, RedirectTransport, ReplayTransport, find_transport, save_recording
+from .rate_limit import async_acquire_request_slot
+from .resilience import is_retryable, record_outcome, remember_negative_result, retry_delay
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 32
+
+# aiohttp errors meaning IMS could not be reached, retried like timeouts and 5xx responses
+_CONNECTION_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError) if aiohttp is not None else ()
+
+_inflight_requests = AsyncSingleFlight()
+_background_tasks = set()
+# Concurrent loads of the same reference maps share one task. Its entries are per event loop and dropped once done,
+# unlike an asyncio.Lock, which is bound to the first loop it is used in.
+_reference_data_loads = AsyncSingleFlight()
+
+
+def create_async_session(
+    limit: int = DEFAULT_CONNECTION_LIMIT,
+    limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+):
+    """
+    Create an aiohttp session with a pooled, keep-alive connector.
+    ims.gov.il does not support ipv6 yet, so the connector resolves ipv4 only.
+    The session asks for compressed responses and leaves their decompression to the library,
+    which decodes them chunk by chunk while counting the bytes received (see compression.get_transfer_stats).
+    parameters:
+        >>> limit: total number of simultaneous connections
+        >>> limit_per_host: number of simultaneous connections to the same host
+    """
+    if aiohttp is None:
+        raise ImportError("aiohttp is required for the async client, install it with: pip install weatheril[async]")
+    connector = aiohttp.TCPConnector(
+        limit=limit, limit_per_host=limit_per_host, family=socket.AF_INET
+    )
+    return aiohttp.ClientSession(
+        connector=connector, auto_decompress=False, headers={"Accept-Encoding": ACCEPT_ENCODING}
+    )
+
+
+async def async_call_with_retries(url: str, coro_fn):
+    """
+    Await coro_fn(), retrying it with jittered exponential backoff while it fails with a retryable error
+    """
+    attempt = 0
+    while True:
+        try:
+            return await coro_fn()
+        except Exception as e:
+            if attempt >= get_retries() or not is_retryable(e, _CONNECTION_ERRORS):
+                raise
+            delay = retry_delay(attempt)
+            logger.warning("Retrying " + url + " in " + format(delay, ".2f") + " seconds. " + str(e))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _request_timeout():
+    return aiohttp.ClientTimeout(total=get_request_timeout())
+
+
+async def _async_get(session, url: str, headers: dict | None = None) -> tuple:
+    """
+    GET an IMS url, applying the transport set with set_transport like the sync client does:
+    answered from the recordings of a ReplayTransport, sent to the server of a RedirectTransport
+    (e.g. StandInServer.transport()), saved by a RecordingTransport.
+    Raises on http errors.
+    return: (status, headers, decoded body), the body is empty for a 304
+    """
+    replay = find_transport(ReplayTransport)
+    if replay is not None:
+        response = replay.get(url)
+        response.raise_for_status()
+        record_response(url, response)
+        return response.status_code, response.headers, response.content
+
+    recording = find_transport(RecordingTransport)
+    redirect = find_transport(RedirectTransport)
+    request_url = redirect.redirect(url) if redirect is not None else url
+    # Like RecordingTransport, no conditional request while recording: a 304 would leave nothing to record
+    async with session.get(
+        request_url, headers=None if recording is not None else headers, timeout=_request_timeout()
+    ) as response:
+        if response.status == 304:
+            record_transfer(url, 0, 0)
+            return response.status, response.headers, b""
+        response.raise_for_status()
+        body = await read_body(session, response, url)
+    if recording is not None:
+        try:
+            save_recording(recording.directory, url, response.status, response.headers, body)
+        except OSError as e:
+            logger.error("Error recording " + url + ". " + str(e))
+    return response.status, response.headers, body
+
+
+async def async_get_cached_data(
+    session,
+    url: str,
+    cache_expiration_in_sec: float | None = None,
+    stale_while_revalidate: bool = False,
+    max_staleness_in_sec: float = DEFAULT_MAX_STALENESS,
+) -> dict:
+    """
+    Get the "data" part of an IMS response from the shared cache, fetching it when missing or expired.
+    Raises on network, http or decoding errors. See utils.get_cached_data for the parameters.
+    """
+    min_retention = max_staleness_in_sec if stale_while_revalidate else 0
+    entry = get_response_cache().get(url)
+    if entry:
+        age = entry.age()
+        if age < entry_expiration(url, cache_expiration_in_sec, entry):
+            return entry.data
+        if stale_while_revalidate and age < max_staleness_in_sec:
+            _async_refresh_in_background(session, url, cache_expiration_in_sec, min_retention)
+            return entry.data
+    # Concurrent callers for the same url await a single request
+    return await _inflight_requests.do(
+        url, lambda: _async_fetch_with_fallback(session, url, cache_expiration_in_sec, min_retention)
+    )
+
+
+async def _async_fetch_with_fallback(session, url: str, cache_expiration_in_sec: float | None, min_retention: float) -> dict:
+    """
+    Fetch the url with retries, unless it failed moments ago or its endpoint circuit is open,
+    serving the last good data when IMS is not called or fails. See utils._fetch_with_fallback.
+    """
+    negative_result = get_negative_result(url)
+    if negative_result is not None:
+        error = negative_result[1]
+        if error is None:
+            return {}
+    elif not get_circuit_breaker(url).allow():
+        error = CircuitOpenError("Circuit open for " + endpoint_of(url) + ", not calling " + url)
+    else:
+        try:
+            data = await async_call_with_retries(
+                url, lambda: _async_fetch_and_cache(session, url, cache_expiration_in_sec, min_retention)
+            )
+        except Exception as e:
+            record_outcome(url, e, _CONNECTION_ERRORS)
+            error = e
+        else:
+            record_outcome(url, None)
+            if not data:
+                remember_negative_result(url, None)
+            return data
+
+    last_good = get_response_cache().get(url)
+    if last_good is not None and last_good.data:
+        logger.warning("Serving last good data of " + url + ". " + str(error))
+        return last_good.data
+    raise error
+
+
+async def _async_fetch_and_cache(session, url: str, cache_expiration_in_sec: float | None, min_retention: float) -> dict:
+    """
+    Fetch the url, revalidating the cached entry (even an expired one) with a conditional request when possible
+    """
+    cache = get_response_cache()
+    previous = cache.get(url)
+    await async_acquire_request_slot(url)
+    logger.debug("Getting data from: " + url)
+    status, headers, body = await _async_get(session, url, conditional_request_headers(previous))
+    if status == 304 and previous is not None:
+        logger.debug("Not modified: " + url)
+        entry = previous.revalidated(max_age_from_headers(headers))
+    else:
+        entry = cache_entry_from_response(url, previous, body, headers)
+    if entry.data:
+        cache.set(url, entry, cache_retention(url, entry, cache_expiration_in_sec, min_retention))
+    return entry.data
+
+
+def _async_refresh_in_background(session, url: str, cache_expiration_in_sec: float | None, min_retention: float):
+    """
+    Start a refresh task for the url, joining the one in flight if there is one
+    """
+    async def refresh():
+        try:
+            await _inflight_requests.do(
+                url, lambda: _async_fetch_with_fallback(session, url, cache_expiration_in_sec, min_retention)
+            )
+        except Exception as e:
+            logger.error("Error refreshing " + url + " in the background. " + str(e))
+
+    logger.debug("Serving stale data, refreshing in the background: " + url)
+    task = asyncio.ensure_future(refresh())
+    # Keep a reference so the task is not garbage collected before it is done
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def async_get_data(
+    session,
+    url: str,
+    cache_expiration_in_sec: float | None = None,
+    stale_while_revalidate: bool = False,
+    max_staleness_in_sec: float = DEFAULT_MAX_STALENESS,
+) -> dict:
+    """
+    Same as async_get_cached_data, returning an empty dict on errors
+    """
+    try:
+        return await async_get_cached_data(
+            session, url, cache_expiration_in_sec, stale_while_revalidate, max_staleness_in_sec
+        )
+    except Exception as e:
+        logger.error("Error getting city portal data. " + str(e))
+        logger.exception(e)
+    return {}
+
+
+async def async_load_reference_data(session, language: str, names=tuple(REFERENCE_DATA_URLS)):
+    """
+    Fetch the reference maps that were not loaded yet concurrently and index them
+    """
+    missing = tuple(get_missing_reference_data(language, names))
+    if not missing:
+        return
+    await _reference_data_loads.do(
+        (language, missing), lambda: _async_load_missing_reference_data(session, language, missing)
+    )
+
+
+async def _async_load_missing_reference_data(session, language: str, missing: tuple):
+    # Overlapping loads of other map sets still fetch each url once, through async_get_cached_data
+    payloads = await asyncio.gather(
+        *(async_get_cached_data(session, REFERENCE_DATA_URLS[name].format(language=language)) for name in missing),
+        return_exceptions=True,
+    )
+    for name, payload in zip(missing, payloads):
+        try:
+            if isinstance(payload, Exception):
+                raise payload
+            load_reference_data(language, name, payload)
+        except Exception as e:
+            logger.error("Error loading " + name + " reference data. " + str(e))
+
+
+async def _async_require_reference_data(session, language: str, names):
+    """
+    Load the reference maps a parser needs before it runs on the event loop, where a missing map would otherwise
+    be fetched with a blocking request. The maps IMS did not return fall back to the shipped tables like in the
+    sync client, ReferenceDataError is raised for the ones without a fallback table.
+    """
+    await async_load_reference_data(session, language, names)
+    missing = [
+        name for name in get_missing_reference_data(language, names) if not load_fallback_reference_data(language, name)
+    ]
+    if missing:
+        raise ReferenceDataError("Reference data not loaded for " + language + ": " + ", ".join(missing))
+
+
+async def async_warm_up(
+    session, languages=("he", "en"), names=tuple(REFERENCE_DATA_URLS), timeout: float | None = None
+) -> bool:
+    """
+    Asyncio version of warm_up: fetch and index the reference maps of all the languages concurrently,
+    e.g. in the startup hook of a service before it accepts traffic
+    parameters:
+        >>> session: the aiohttp.ClientSession used for the requests, see create_async_session
+        >>> languages: languages to load
+        >>> names: the reference maps to load, keys of REFERENCE_DATA_URLS. default is all of them
+        >>> timeout: seconds to wait, the loads still running then go on in the background. default waits for all
+    return: True when every map is loaded
+    """
+    loads = asyncio.ensure_future(
+        asyncio.gather(*(async_load_reference_data(session, language, names) for language in languages))
+    )
+    _background_tasks.add(loads)
+    loads.add_done_callback(_background_tasks.discard)
+    await asyncio.wait({loads}, timeout=timeout)
+    ready = True
+    for language in languages:
+        not_loaded = get_missing_reference_data(language, names)
+        if not_loaded:
+            logger.warning("Reference data not loaded for " + language + ": " + ", ".join(not_loaded))
+            ready = False
+    return ready
+
+
+class AsyncWeatherIL:
+    def __init__(
+        self,
+        location,
+        language="he",
+        cache_expiration_in_sec=None,
+        session=None,
+        stale_while_revalidate=False,
+        max_staleness_in_sec=DEFAULT_MAX_STALENESS,
+    ):
+        """
+        Init the AsyncWeatherIL object.
+        parameters:
+            >>> location: Location Id for the forecast (Table exists in the readme)
+            >>> language: can be he (Hebrew) or en (English). default will be "he"
+            >>> cache_expiration_in_sec: how long responses are served from the process-wide cache.
+                                         default (None) uses the per-endpoint expiration, see set_cache_expiration
+            >>> session: aiohttp.ClientSession to share between clients. when not provided the client creates
+                         its own session and closes it in close()
+            >>> stale_while_revalidate: return expired data at once and refresh it in the background. default is False
+            >>> max_staleness_in_sec: oldest expired data returned in stale_while_revalidate mode. default is 300 seconds
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async client, install it with: pip install weatheril[async]")
+        self._cache_expiration_in_sec = cache_expiration_in_sec
+        self._stale_while_revalidate = stale_while_revalidate
+        self._max_staleness_in_sec = max_staleness_in_sec
+        self.language = language
+        self.location = str(location)
+        # Whether the last get_current_analysis / get_forecast / get_warnings call got a payload
+        # different from the call before it. None until called.
+        self.analysis_changed = None
+        self.forecast_changed = None
+        self.warnings_changed = None
+        self._last_payloads = {}
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the aiohttp session if it was created by this client
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = create_async_session()
+        return self._session
+
+    async def get_current_analysis(self):
+        analysis_data = await self._get_analysis_data()
+        self.analysis_changed = self._payload_changed("analysis", analysis_data)
+        try:
+            await _async_require_reference_data(self._get_session(), self.language, ANALYSIS_REFERENCE_DATA)
+            logger.debug("Getting current analysis")
+            return memoized_parse(
+                "analysis", self.language, self.location, analysis_data,
+                lambda data: parse_current_analysis(self.language, self.location, data)
+            )
+        except Exception as e:
+            logger.error("Error getting current analysis.")
+            logger.exception(e)
+            return None
+
+    async def get_forecast(self):
+        """
+        Get weather forecast
+        return: Forecast object
+        """
+        logger.debug("Getting forecast")
+        forecast_data = await self._get_forecast_data()
+        self.forecast_changed = self._payload_changed("forecast", forecast_data)
+        try:
+            await _async_require_reference_data(self._get_session(), self.language, FORECAST_REFERENCE_DATA)
+            logger.debug("Got forecast for location " + str(self.location))
+            return memoized_parse(
+                "forecast", self.language, self.location, forecast_data,
+                lambda data: parse_forecast(self.language, data)
+            )
+        except Exception as e:
+            logger.error("Error getting forecast data")
+            logger.exception(e)
+            return None
+
+    async def get_radar_images(self):
+        """
+        Get the list of images for Satellite and Radar
+        return: RadarSatellite objects with the lists
+        """
+        try:
+            logger.debug("Getting radar images")
+            url = RADAR_SATELLITE_URL.format(language=self.language)
+            return parse_radar_images(await async_get_data(self._get_session(), url))
+        except Exception as e:
+            logger.error("Error getting images. " + str(e))
+            return RadarSatellite([], [], [], [])
+
+    async def get_warnings(self):
+        """
+        Get weather warnings for the location region
+        return: list of Warning objects
+        """
+        logger.debug("Getting warnings")
+        full_warnings_data = await self._get_warnings_data()
+        self.warnings_changed = self._payload_changed("warnings", full_warnings_data)
+        await _async_require_reference_data(self._get_session(), self.language, WARNINGS_REFERENCE_DATA)
+        # Memoized as a tuple shared between callers, each caller gets its own list
+        return list(memoized_parse(
+            "warnings", self.language, self.location, full_warnings_data,
+            lambda data: tuple(parse_warnings(self.language, self.location, data))
+        ))
+
+    def _payload_changed(self, kind: str, data: dict) -> bool:
+        """
+        Whether data differs from the payload this client got for kind the previous time.
+        The cache hands out an unchanged IMS payload as the same object, so identity is enough.
+        """
+        if not data:
+            return False
+        previous = self._last_payloads.get(kind)
+        self._last_payloads[kind] = data
+        return data is not previous
+
+    async def _get_analysis_data(self) -> dict:
+        """
+        Get the city current analysis data
+        """
+        url = CURRENT_ANALYSIS_URL.format(language=self.language, location=self.location)
+        return await async_get_data(
+            self._get_session(), url, self._cache_expiration_in_sec, self._stale_while_revalidate, self._max_staleness_in_sec
+        )
+
+    async def _get_forecast_data(self) -> dict:
+        """
+        Get the city forecast data
+        """
+        url = FORECAST_URL.format(language=self.language, location=self.location)
+        return await async_get_data(
+            self._get_session(), url, self._cache_expiration_in_sec, self._stale_while_revalidate, self._max_staleness_in_sec
+        )
+
+    async def _get_warnings_data(self) -> dict:
+        """
+        Get the all warning data
+        """
+        url = WARNINGS_URL.format(language=self.language)
+        return await async_get_data(
+            self._get_session(), url, self._cache_expiration_in_sec, self._stale_while_revalidate, self._max_staleness_in_sec
+        )
+
+async def async_get_forecasts(
+    lids, language="he", max_concurrency=DEFAULT_MAX_CONCURRENCY, session=None,
+    cache_expiration_in_sec=None
+) -> dict:
+    """
+    Get the forecast of many locations concurrently.
+    parameters:
+        >>> lids: iterable of location ids
+        >>> language: can be he (Hebrew) or en (English). default will be "he"
+        >>> max_concurrency: maximum number of requests in flight at once
+        >>> session: aiohttp.ClientSession to use, a temporary one is created when not provided
+        >>> cache_expiration_in_sec: how long responses are served from the process-wide cache,
+                                     None for the per-endpoint expiration
+    return: dict of location id (str) to Forecast object, or to the exception raised for that location
+    """
+    return await _async_batch(
+        lids, language, max_concurrency, session, cache_expiration_in_sec, FORECAST_URL, FORECAST_REFERENCE_DATA, _parse_batch_forecast
+    )
+
+
+async def async_get_current_analyses(
+    lids, language="he", max_concurrency=DEFAULT_MAX_CONCURRENCY, session=None,
+    cache_expiration_in_sec=None
+) -> dict:
+    """
+    Get the current analysis of many locations concurrently.
+    parameters:
+        >>> lids: iterable of location ids
+        >>> language: can be he (Hebrew) or en (English). default will be "he"
+        >>> max_concurrency: maximum number of requests in flight at once
+        >>> session: aiohttp.ClientSession to use, a temporary one is created when not provided
+        >>> cache_expiration_in_sec: how long responses are served from the process-wide cache,
+                                     None for the per-endpoint expiration
+    return: dict of location id (str) to Weather object, or to the exception raised for that location
+    """
+    return await _async_batch(
+        lids, language, max_concurrency, session, cache_expiration_in_sec, CURRENT_ANALYSIS_URL, ANALYSIS_REFERENCE_DATA, _parse_batch_analysis
+    )
+
+
+async def _async_batch(lids, language, max_concurrency, session, cache_expiration_in_sec, url_template, reference_data, parse) -> dict:
+    owns_session = session is None
+    if owns_session:
+        session = create_async_session(limit_per_host=max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(lid):
+        async with semaphore:
+            url = url_template.format(language=language, location=lid)
+            data = await async_get_cached_data(session, url, cache_expiration_in_sec)
+        return parse(language, lid, data)
+
+    try:
+        lids = [str(lid) for lid in lids]
+        try:
+            await _async_require_reference_data(session, language, reference_data)
+        except ReferenceDataError as e:
+            logger.error(str(e))
+            return {lid: e for lid in lids}
+        results = await asyncio.gather(*(fetch_one(lid) for lid in lids), return_exceptions=True)
+        return dict(zip(lids, results))
+    finally:
+        if owns_session:
+            await session.close()
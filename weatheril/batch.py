@@ -0,0 +1,76 @@
+"""Fetch the forecast and current analysis of many locations concurrently"""
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from .consts import CURRENT_ANALYSIS_URL, FORECAST_URL
+from .parsing import parse_current_analysis, parse_forecast, memoized_parse, ANALYSIS_REFERENCE_DATA, FORECAST_REFERENCE_DATA
+from .utils import ensure_reference_data, get_cached_data
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def get_forecasts(
+    lids, language="he", max_concurrency=DEFAULT_MAX_CONCURRENCY, cache_expiration_in_sec=None
+) -> dict:
+    """
+    Get the forecast of many locations concurrently.
+    parameters:
+        >>> lids: iterable of location ids
+        >>> language: can be he (Hebrew) or en (English). default will be "he"
+        >>> max_concurrency: maximum number of requests in flight at once
+        >>> cache_expiration_in_sec: how long responses are served from the process-wide cache,
+                                     None for the per-endpoint expiration
+    return: dict of location id (str) to Forecast object, or to the exception raised for that location
+    """
+    return _batch(lids, language, max_concurrency, cache_expiration_in_sec, FORECAST_URL, FORECAST_REFERENCE_DATA, _parse_batch_forecast)
+
+
+def get_current_analyses(
+    lids, language="he", max_concurrency=DEFAULT_MAX_CONCURRENCY, cache_expiration_in_sec=None
+) -> dict:
+    """
+    Get the current analysis of many locations concurrently.
+    parameters:
+        >>> lids: iterable of location ids
+        >>> language: can be he (Hebrew) or en (English). default will be "he"
+        >>> max_concurrency: maximum number of requests in flight at once
+        >>> cache_expiration_in_sec: how long responses are served from the process-wide cache,
+                                     None for the per-endpoint expiration
+    return: dict of location id (str) to Weather object, or to the exception raised for that location
+    """
+    return _batch(lids, language, max_concurrency, cache_expiration_in_sec, CURRENT_ANALYSIS_URL, ANALYSIS_REFERENCE_DATA, _parse_batch_analysis)
+
+
+def _batch(lids, language, max_concurrency, cache_expiration_in_sec, url_template, reference_data, parse) -> dict:
+    lids = [str(lid) for lid in lids]
+    # Load the shared reference maps once, before the workers start looking them up
+    ensure_reference_data(language, reference_data)
+
+    def fetch_one(lid):
+        url = url_template.format(language=language, location=lid)
+        return parse(language, lid, get_cached_data(url, cache_expiration_in_sec))
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {lid: executor.submit(fetch_one, lid) for lid in lids}
+        for lid, future in futures.items():
+            try:
+                results[lid] = future.result()
+            except Exception as e:
+                logger.error("Error getting data for location " + lid + ". " + str(e))
+                results[lid] = e
+    return results
+
+
+def _parse_batch_forecast(language, lid, data):
+    if not data:
+        raise ValueError(f"No forecast data for location {lid}")
+    return memoized_parse("forecast", language, lid, data, lambda data: parse_forecast(language, data))
+
+
+def _parse_batch_analysis(language, lid, data):
+    weather = memoized_parse("analysis", language, lid, data, lambda data: parse_current_analysis(language, lid, data))
+    if weather is None:
+        raise ValueError(f"No current analysis for location {lid}")
+    return weather
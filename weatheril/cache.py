@@ -0,0 +1,435 @@
+"""Process-wide cache of IMS responses, keyed by url, on top of a pluggable storage backend"""
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from loguru import logger
+
+from . import json_backend
+
+SQLITE_CACHE_FILE_NAME = "weatheril-cache.sqlite3"
+REDIS_KEY_PREFIX = "weatheril:"
+
+
+@dataclass
+class CacheEntry:
+    data: dict
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    # Freshness lifetime from the Cache-Control / Expires response headers, if IMS sent them
+    max_age: float | None = None
+    # When IMS published the data (see cache_policy.published_at_of), used by the adaptive refresh
+    published_at: float | None = None
+    # Raw IMS response body the data was decoded from, stored as is instead of re-encoding the data
+    body: bytes | None = field(default=None, repr=False, compare=False)
+    # body_fingerprint of the body, to tell a refetched identical payload from a new one
+    fingerprint: str | None = None
+    # When IMS last returned a different payload, stays put while refetches return the same bytes
+    changed_at: float | None = None
+
+    def age(self) -> float:
+        """
+        Seconds since the data was fetched (or revalidated) from IMS
+        """
+        return time.time() - self.fetched_at
+
+    def revalidated(self, max_age: float | None = None) -> "CacheEntry":
+        """
+        Copy of the entry marked as fetched now, used when IMS answers 304 Not Modified
+        """
+        return CacheEntry(
+            self.data, time.time(), self.etag, self.last_modified, max_age,
+            self.published_at, self.body, self.fingerprint, self.changed_at,
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the entry as a one line json header followed by the IMS response body
+        """
+        header = {
+            "fetched_at": self.fetched_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "max_age": self.max_age,
+            "published_at": self.published_at,
+            "fingerprint": self.fingerprint,
+            "changed_at": self.changed_at,
+        }
+        body = self.body if self.body is not None else json.dumps({"data": self.data}).encode()
+        return json.dumps(header).encode() + b"\n" + body
+
+    @classmethod
+    def from_bytes(cls, value: bytes, previous: "CacheEntry | None" = None) -> "CacheEntry":
+        """
+        Deserialize an entry. The body is only decoded when it differs from the one of previous
+        (an entry read before for the same key), otherwise the data object of previous is reused.
+        """
+        header, _, body = value.partition(b"\n")
+        header = json.loads(header)
+        fingerprint = header.get("fingerprint") or body_fingerprint(body)
+        if previous is not None and previous.fingerprint == fingerprint:
+            data = previous.data
+        else:
+            data = json_backend.loads(body).get("data", {})
+        return cls(
+            data=data,
+            fetched_at=header["fetched_at"],
+            etag=header.get("etag"),
+            last_modified=header.get("last_modified"),
+            max_age=header.get("max_age"),
+            published_at=header.get("published_at"),
+            body=body,
+            fingerprint=fingerprint,
+            changed_at=header.get("changed_at", header["fetched_at"]),
+        )
+
+
+def body_fingerprint(body: bytes) -> str:
+    """
+    Short fingerprint of a response body: its length and a 128 bit blake2b hash
+    """
+    return str(len(body)) + ":" + hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """
+    Storage used by the response cache. Values are opaque bytes, ttl is in seconds.
+    """
+
+    def get(self, key: str) -> bytes | None:
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float):
+        ...
+
+    def ttl(self, key: str) -> float | None:
+        """
+        Remaining seconds before the key expires, None if the key does not exist
+        """
+        ...
+
+    def delete(self, key: str):
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    Thread-safe in-process backend, the default
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+
+    def ttl(self, key: str) -> float | None:
+        with self._lock:
+            item = self._entries.get(key)
+        if item is None:
+            return None
+        remaining = item[1] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """
+    Persistent backend storing the entries in a SQLite file, so a restarted process
+    serves what it fetched before instead of going to IMS.
+    parameters:
+        >>> directory: directory of the cache file, created if missing. processes on the same host may share it
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, SQLITE_CACHE_FILE_NAME)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+
+    def ttl(self, key: str) -> float | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        remaining = row[0] - time.time()
+        return remaining if remaining > 0 else None
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisCacheBackend:
+    """
+    Out-of-process backend speaking the Redis protocol (RESP) over a plain socket,
+    so every worker process and host shares one copy of the IMS data.
+    Works with Redis and any server implementing GET/SET PX/PTTL/DEL/SCAN.
+    parameters:
+        >>> host, port: server address. default is localhost:6379
+        >>> db: database number selected after connecting
+        >>> password: sent with AUTH when provided
+        >>> prefix: prepended to every key
+        >>> timeout: socket timeout in seconds
+    """
+
+    def __init__(self, host="localhost", port=6379, db=0, password=None, prefix=REDIS_KEY_PREFIX, timeout=5.0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        self.timeout = timeout
+        self._socket = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        return self._execute("GET", self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self._execute("SET", self.prefix + key, value, "PX", max(1, int(ttl * 1000)))
+
+    def ttl(self, key: str) -> float | None:
+        remaining = self._execute("PTTL", self.prefix + key)
+        # -2: missing key, -1: key without expiry
+        if remaining == -2:
+            return None
+        return float("inf") if remaining == -1 else remaining / 1000
+
+    def delete(self, key: str):
+        self._execute("DEL", self.prefix + key)
+
+    def clear(self):
+        """
+        Delete every key under the prefix
+        """
+        cursor = b"0"
+        while True:
+            cursor, keys = self._execute("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 500)
+            if keys:
+                self._execute("DEL", *keys)
+            if cursor == b"0":
+                return
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+    def _execute(self, *args):
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._socket is None:
+                        self._connect()
+                    self._socket.sendall(_encode_command(args))
+                    return self._read_reply()
+                except (OSError, EOFError) as e:
+                    # A pooled connection may have been closed by the server, reconnect once
+                    self._disconnect()
+                    if attempt:
+                        raise RedisError("Error talking to redis at " + self.host + ":" + str(self.port)) from e
+
+    def _connect(self):
+        self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._reader = self._socket.makefile("rb")
+        if self.password:
+            self._socket.sendall(_encode_command(("AUTH", self.password)))
+            self._read_reply()
+        if self.db:
+            self._socket.sendall(_encode_command(("SELECT", self.db)))
+            self._read_reply()
+
+    def _disconnect(self):
+        if self._socket is not None:
+            try:
+                self._reader.close()
+                self._socket.close()
+            except OSError as e:
+                logger.debug("Error closing redis connection. " + str(e))
+        self._socket = None
+        self._reader = None
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line:
+            raise EOFError("Connection closed by redis")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload
+        if kind == b"-":
+            raise RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError("Unexpected redis reply: " + repr(line))
+
+
+def _encode_command(args) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif isinstance(arg, int):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+class ResponseCache:
+    """
+    Cache of CacheEntry objects on top of a CacheBackend.
+    The last decoded entry of every key is kept, so reading a value the backend did not change skips json decoding,
+    and a value holding the same IMS payload (e.g. refetched by another process) keeps the same data object.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self._decoded = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.error("Error reading " + key + " from the cache backend. " + str(e))
+            return None
+        if value is None:
+            with self._lock:
+                self._decoded.pop(key, None)
+            return None
+        with self._lock:
+            decoded = self._decoded.get(key)
+        if decoded is not None and (decoded[0] is value or decoded[0] == value):
+            return decoded[1]
+        try:
+            entry = CacheEntry.from_bytes(value, decoded[1] if decoded is not None else None)
+        except (ValueError, KeyError) as e:
+            logger.error("Dropping unreadable cache entry for " + key + ". " + str(e))
+            self.delete(key)
+            return None
+        with self._lock:
+            self._decoded[key] = (value, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry, ttl: float):
+        value = entry.to_bytes()
+        with self._lock:
+            self._decoded[key] = (value, entry)
+        try:
+            self.backend.set(key, value, ttl)
+        except Exception as e:
+            logger.error("Error writing " + key + " to the cache backend. " + str(e))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._decoded.pop(key, None)
+        self.backend.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._decoded.clear()
+        if hasattr(self.backend, "clear"):
+            self.backend.clear()
+
+
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the cache shared by every WeatherIL / AsyncWeatherIL instance
+    """
+    return _response_cache
+
+
+def set_response_cache(cache: ResponseCache):
+    """
+    Replace the shared response cache
+    """
+    global _response_cache
+    _response_cache = cache
+
+
+def set_cache_backend(backend: CacheBackend):
+    """
+    Store the shared cache in the given backend, e.g. SQLiteCacheBackend for warm restarts
+    or RedisCacheBackend to share it between processes and hosts
+    """
+    set_response_cache(ResponseCache(backend))
+
+
+def clear_response_cache():
+    """
+    Drop every cached response, the next call for each url goes to IMS
+    """
+    _response_cache.clear()
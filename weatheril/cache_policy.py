@@ -0,0 +1,202 @@
+"""Per-endpoint cache expiration, configurable, taken from the IMS caching headers
+or adapted to when IMS publishes new data"""
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from . import consts
+from .consts import DEFAULT_CACHE_EXPIRATION, REFERENCE_DATA_CACHE_EXPIRATION
+
+# Default expiration in seconds per IMS endpoint (the url path part after the language)
+ENDPOINT_CACHE_EXPIRATION = {
+    "now_analysis": DEFAULT_CACHE_EXPIRATION,
+    "warnings": DEFAULT_CACHE_EXPIRATION,
+    "full_forecast_data": 15 * 60,
+    "radar_satellite": 5 * 60,
+    "weather_codes": REFERENCE_DATA_CACHE_EXPIRATION,
+    "locations_info": REFERENCE_DATA_CACHE_EXPIRATION,
+    "wind_directions": REFERENCE_DATA_CACHE_EXPIRATION,
+    "regions": REFERENCE_DATA_CACHE_EXPIRATION,
+    "sea_regions": REFERENCE_DATA_CACHE_EXPIRATION,
+    "warnings_metadata": REFERENCE_DATA_CACHE_EXPIRATION,
+}
+
+# Expected seconds between two IMS publications, used until enough publications were observed
+PUBLICATION_INTERVALS = {
+    "now_analysis": 10 * 60,
+    "full_forecast_data": 60 * 60,
+}
+PUBLICATION_HISTORY_SIZE = 8
+DEFAULT_ADAPTIVE_REFRESH_GRACE = 60
+
+_cache_expirations = dict(ENDPOINT_CACHE_EXPIRATION)
+_use_cache_headers = False
+_adaptive_refresh = False
+_adaptive_refresh_grace = DEFAULT_ADAPTIVE_REFRESH_GRACE
+_publications = {}
+_publications_lock = threading.Lock()
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Get the endpoint name of an IMS api url, e.g. "full_forecast_data" for https://ims.gov.il/he/full_forecast_data/21
+    """
+    parts = urlparse(url).path.strip("/").split("/")
+    return parts[1] if len(parts) > 1 else parts[0]
+
+
+def set_cache_expiration(endpoint: str, seconds: float):
+    """
+    Set the cache expiration of an endpoint (one of the ENDPOINT_CACHE_EXPIRATION keys)
+    """
+    _cache_expirations[endpoint] = seconds
+
+
+def get_cache_expiration(url: str) -> float:
+    """
+    Get the configured cache expiration for the endpoint of the url
+    """
+    return _cache_expirations.get(endpoint_of(url), DEFAULT_CACHE_EXPIRATION)
+
+
+def use_cache_headers(enabled: bool = True):
+    """
+    When enabled, the Cache-Control / Expires headers returned by IMS decide how long a response is fresh,
+    falling back to the endpoint expiration for responses without them
+    """
+    global _use_cache_headers
+    _use_cache_headers = enabled
+
+
+def resolve_cache_expiration(url: str, cache_expiration_in_sec: float | None, max_age: float | None = None) -> float:
+    """
+    Get the expiration to apply to a cached response.
+    parameters:
+        >>> url: the IMS url
+        >>> cache_expiration_in_sec: explicit expiration given by the caller, wins over everything else when not None
+        >>> max_age: freshness lifetime taken from the response headers, if any
+    """
+    if cache_expiration_in_sec is not None:
+        return cache_expiration_in_sec
+    if _use_cache_headers and max_age is not None:
+        return max_age
+    return get_cache_expiration(url)
+
+
+def max_age_from_headers(headers) -> float | None:
+    """
+    Freshness lifetime in seconds of a response, from its Cache-Control (s-maxage / max-age, minus Age)
+    or Expires headers. None when the headers do not say.
+    """
+    cache_control = headers.get("Cache-Control") or ""
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                age = float(headers.get("Age") or 0)
+                return max(0.0, float(directives[name]) - age)
+            except ValueError:
+                return None
+
+    expires = headers.get("Expires")
+    if not expires:
+        return None
+    try:
+        expires_at = parsedate_to_datetime(expires).timestamp()
+        date = headers.get("Date")
+        now = parsedate_to_datetime(date).timestamp() if date else time.time()
+    except (TypeError, ValueError):
+        # An invalid Expires (e.g. "0") means already expired
+        return 0.0
+    return max(0.0, expires_at - now)
+
+
+def use_adaptive_refresh(enabled: bool = True, grace_in_sec: float = DEFAULT_ADAPTIVE_REFRESH_GRACE):
+    """
+    When enabled, now_analysis and full_forecast_data responses stay fresh until shortly after
+    the next publication expected from their modified / created timestamps, instead of being
+    polled every cache expiration. Once a publication is overdue the regular expiration applies again.
+    parameters:
+        >>> enabled: turn the adaptive refresh on or off
+        >>> grace_in_sec: how long after the expected publication time to ask IMS again
+    """
+    global _adaptive_refresh, _adaptive_refresh_grace
+    _adaptive_refresh = enabled
+    _adaptive_refresh_grace = grace_in_sec
+
+
+def entry_expiration(url: str, cache_expiration_in_sec: float | None, entry) -> float:
+    """
+    Expiration of a cached entry, in seconds after its fetch time: the resolved expiration,
+    extended by the adaptive refresh until the next expected IMS publication
+    """
+    expiration = resolve_cache_expiration(url, cache_expiration_in_sec, entry.max_age)
+    if _adaptive_refresh and entry.published_at is not None:
+        next_publication = predict_next_publication(url, entry.published_at)
+        if next_publication is not None:
+            expiration = max(expiration, next_publication + _adaptive_refresh_grace - entry.fetched_at)
+    return expiration
+
+
+def published_at_of(url: str, data: dict) -> float | None:
+    """
+    Latest IMS publication time (epoch seconds) found in a response data:
+    the "modified" of now_analysis or the newest hourly "created" of full_forecast_data
+    """
+    endpoint = endpoint_of(url)
+    try:
+        if endpoint == "now_analysis":
+            stamps = [analysis.get("modified") for analysis in data.values()]
+        elif endpoint == "full_forecast_data":
+            stamps = [
+                hour.get("created")
+                for day in data.values()
+                for hour in (day.get("hourly") or {}).values()
+            ]
+        else:
+            return None
+        stamps = [stamp for stamp in stamps if stamp]
+        if not stamps:
+            return None
+        # All the stamps share the "%Y-%m-%d %H:%M:%S" format, so the newest one sorts last
+        latest = datetime.strptime(max(stamps), "%Y-%m-%d %H:%M:%S")
+        return consts.TIMEZONE.localize(latest).timestamp()
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def observe_publication(url: str, published_at: float | None):
+    """
+    Record the publication time of a freshly fetched response
+    """
+    if published_at is None:
+        return
+    with _publications_lock:
+        history = _publications.setdefault(url, deque(maxlen=PUBLICATION_HISTORY_SIZE))
+        if not history or published_at > history[-1]:
+            history.append(published_at)
+
+
+def predict_next_publication(url: str, published_at: float) -> float | None:
+    """
+    Expected time of the publication following published_at, from the median interval observed
+    for the url (or the endpoint default). None when unknown or already overdue.
+    """
+    with _publications_lock:
+        history = list(_publications.get(url, ()))
+    intervals = [later - earlier for earlier, later in zip(history, history[1:])]
+    interval = statistics.median(intervals) if intervals else PUBLICATION_INTERVALS.get(endpoint_of(url))
+    if not interval:
+        return None
+    next_publication = published_at + interval
+    return next_publication if next_publication > time.time() else None
@@ -0,0 +1,195 @@
+"""Compressed transfer negotiation, incremental decompression, and wire / decoded byte counts per endpoint"""
+import threading
+import zlib
+
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+
+from .cache_policy import endpoint_of
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Content codings requested by the sync client, all the ones urllib3 can decode here
+SYNC_ACCEPT_ENCODING = ", ".join(URLLIB3_ACCEPT_ENCODING.split(","))
+# Content codings requested by the async client, which decodes the responses itself
+ACCEPT_ENCODING = ", ".join(
+    ["gzip", "deflate"] + (["br"] if brotli is not None else []) + (["zstd"] if zstandard is not None else [])
+)
+# Size of the chunks read from the async response stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_transfer_stats = {}
+_transfer_stats_lock = threading.Lock()
+
+
+class _DeflateDecoder:
+    """
+    "deflate" is sent zlib wrapped or raw depending on the server, try zlib first
+    """
+
+    def __init__(self):
+        self._first_try = True
+        self._data = b""
+        self._decoder = zlib.decompressobj()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if not self._first_try:
+            return self._decoder.decompress(chunk)
+        self._data += chunk
+        try:
+            decompressed = self._decoder.decompress(chunk)
+            if decompressed:
+                self._first_try = False
+                self._data = b""
+            return decompressed
+        except zlib.error:
+            self._first_try = False
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            data, self._data = self._data, b""
+            return self._decoder.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decoder.flush()
+
+
+class _BrotliDecoder:
+    def __init__(self):
+        self._decoder = brotli.Decompressor()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        return self._decoder.process(chunk)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _MultiDecoder:
+    """
+    Decoder of a body encoded several times, e.g. "Content-Encoding: gzip, br", undone in reverse order
+    """
+
+    def __init__(self, decoders: list):
+        self._decoders = decoders
+
+    def decompress(self, chunk: bytes) -> bytes:
+        for decoder in self._decoders:
+            chunk = decoder.decompress(chunk)
+        return chunk
+
+    def flush(self) -> bytes:
+        data = b""
+        for decoder in self._decoders:
+            data = decoder.decompress(data) + decoder.flush()
+        return data
+
+
+def decompressor(content_encoding: str | None):
+    """
+    Incremental decoder (decompress(chunk) / flush()) for a Content-Encoding header value,
+    None when the body is not encoded. Raises ValueError for an unsupported coding.
+    """
+    codings = [coding.strip().lower() for coding in (content_encoding or "").split(",")]
+    codings = [coding for coding in codings if coding and coding != "identity"]
+    decoders = []
+    for coding in reversed(codings):
+        if coding in ("gzip", "x-gzip"):
+            decoders.append(zlib.decompressobj(16 + zlib.MAX_WBITS))
+        elif coding == "deflate":
+            decoders.append(_DeflateDecoder())
+        elif coding == "br" and brotli is not None:
+            decoders.append(_BrotliDecoder())
+        elif coding == "zstd" and zstandard is not None:
+            decoders.append(zstandard.ZstdDecompressor().decompressobj())
+        else:
+            raise ValueError("Unsupported Content-Encoding: " + coding)
+    if not decoders:
+        return None
+    return decoders[0] if len(decoders) == 1 else _MultiDecoder(decoders)
+
+
+def wire_bytes_of(response, decoded_bytes: int) -> int:
+    """
+    Bytes a requests.Response (or a replayed one) took on the wire, before decompression
+    """
+    raw = getattr(response, "raw", None)
+    if raw is not None and hasattr(raw, "tell"):
+        try:
+            return raw.tell()
+        except (OSError, ValueError):
+            pass
+    length = response.headers.get("Content-Length")
+    if length and response.headers.get("Content-Encoding"):
+        return int(length)
+    return decoded_bytes
+
+
+def record_response(url: str, response):
+    """
+    Add a requests.Response (or a replayed one) to the transfer statistics of its endpoint
+    """
+    decoded_bytes = len(response.content)
+    record_transfer(url, wire_bytes_of(response, decoded_bytes), decoded_bytes)
+
+
+async def read_body(session, response, url: str) -> bytes:
+    """
+    Read an aiohttp response body. When the session leaves the decompression to us (see create_async_session),
+    the body is decompressed chunk by chunk as it arrives, and the wire bytes are counted exactly.
+    """
+    if getattr(session, "auto_decompress", True):
+        body = await response.read()
+        length = response.headers.get("Content-Length")
+        wire_bytes = int(length) if length and response.headers.get("Content-Encoding") else len(body)
+        record_transfer(url, wire_bytes, len(body))
+        return body
+
+    decoder = decompressor(response.headers.get("Content-Encoding"))
+    wire_bytes = 0
+    chunks = []
+    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+        wire_bytes += len(chunk)
+        chunks.append(decoder.decompress(chunk) if decoder is not None else chunk)
+    if decoder is not None:
+        chunks.append(decoder.flush())
+    body = b"".join(chunks)
+    record_transfer(url, wire_bytes, len(body))
+    return body
+
+
+def record_transfer(url: str, wire_bytes: int, decoded_bytes: int):
+    """
+    Add a response to the transfer statistics of its endpoint
+    """
+    with _transfer_stats_lock:
+        stats = _transfer_stats.setdefault(endpoint_of(url), [0, 0, 0])
+        stats[0] += 1
+        stats[1] += wire_bytes
+        stats[2] += decoded_bytes
+
+
+def get_transfer_stats() -> dict:
+    """
+    Transferred bytes per endpoint since the start (or the last reset_transfer_stats):
+    {endpoint: {"responses": ..., "wire_bytes": ..., "decoded_bytes": ...}}.
+    The bandwidth saved by compression is decoded_bytes - wire_bytes.
+    """
+    with _transfer_stats_lock:
+        return {
+            endpoint: {"responses": responses, "wire_bytes": wire_bytes, "decoded_bytes": decoded_bytes}
+            for endpoint, (responses, wire_bytes, decoded_bytes) in _transfer_stats.items()
+        }
+
+
+def reset_transfer_stats():
+    with _transfer_stats_lock:
+        _transfer_stats.clear()
@@ -13,12 +13,16 @@ from .utils import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class Forecast:
-    days: list[Daily] = field(default_factory=list)
+    days: tuple[Daily, ...] = ()
+
+    def __post_init__(self):
+        # Memoized forecasts are shared between callers, so their sequences are immutable too
+        object.__setattr__(self, "days", tuple(self.days))
 
 
-@dataclass
+@dataclass(frozen=True)
 class Daily:
     language: str
     date: datetime
@@ -29,18 +33,20 @@ class Daily:
     maximum_uvi: int
     u_v_i_factor: float
     description: str
-    hours: list[Hourly] = field(default_factory=list)
+    hours: tuple[Hourly, ...] | None = ()
     day: str = field(init=False)
     location: str = field(init=False)
     weather: str = field(init=False)
 
     def __post_init__(self):
-        self.day = get_day_of_the_week(self.language, self.date)
-        self.location = get_location_name_by_id(self.language, self.lid)
-        self.weather = get_weather_description_by_code(self.language, self.weather_code)
+        if self.hours is not None:
+            object.__setattr__(self, "hours", tuple(self.hours))
+        object.__setattr__(self, "day", get_day_of_the_week(self.language, self.date))
+        object.__setattr__(self, "location", get_location_name_by_id(self.language, self.lid))
+        object.__setattr__(self, "weather", get_weather_description_by_code(self.language, self.weather_code))
 
 
-@dataclass
+@dataclass(frozen=True)
 class Hourly:
     language: str
     hour: str
@@ -66,8 +72,8 @@ class Hourly:
     gust_speed: Optional[int]
 
     def __post_init__(self):
-        self.weather = get_weather_description_by_code(self.language, self.weather_code)
-        self.wind_direction = get_wind_direction(self.language, self.wind_direction_id)
+        object.__setattr__(self, "weather", get_weather_description_by_code(self.language, self.weather_code))
+        object.__setattr__(self, "wind_direction", get_wind_direction(self.language, self.wind_direction_id))
 
 
 class ForecastEncoder(JSONEncoder):
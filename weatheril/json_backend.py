@@ -0,0 +1,52 @@
+"""JSON decoding straight from response bytes, with the fastest installed backend: orjson, simdjson or the stdlib"""
+import json
+
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Backends by preference, with the decoder used for each one. All of them accept bytes and raise ValueError subclasses.
+JSON_BACKENDS = {}
+if orjson is not None:
+    JSON_BACKENDS["orjson"] = orjson.loads
+if simdjson is not None:
+    JSON_BACKENDS["simdjson"] = simdjson.loads
+JSON_BACKENDS["json"] = json.loads
+
+_backend = next(iter(JSON_BACKENDS))
+_loads = JSON_BACKENDS[_backend]
+
+
+def loads(data: bytes | str):
+    """
+    Decode a json document with the selected backend. Pass the response bytes rather than text,
+    the backends decode utf-8 themselves without building an intermediate str.
+    """
+    return _loads(data)
+
+
+def get_json_backend() -> str:
+    """
+    Name of the backend decoding the IMS responses: "orjson", "simdjson" or "json"
+    """
+    return _backend
+
+
+def set_json_backend(name: str):
+    """
+    Select the json backend by name, one of the installed JSON_BACKENDS
+    """
+    global _backend, _loads
+    if name not in JSON_BACKENDS:
+        raise ValueError("Json backend " + name + " is not installed. Installed: " + ", ".join(JSON_BACKENDS))
+    _backend = name
+    _loads = JSON_BACKENDS[name]
+    logger.debug("Decoding json with " + name)
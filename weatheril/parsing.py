@@ -0,0 +1,303 @@
+"""Convert raw IMS payloads into the weatheril model objects"""
+import threading
+from datetime import datetime
+
+from loguru import logger
+
+from . import consts
+from .consts import IMS_API_URL_BASE
+from .forecast import Forecast, Daily, Hourly
+from .radar_satellite import RadarSatellite
+from .utils import get_region_by_id, get_value, get_location_info_by_id
+from .warning import Warning
+from .weather import Weather
+
+DAILY_KEY = "daily"
+HOURLY_KEY = "hourly"
+FULL_WARNINGS_DATA_KEY = "full_warnings_data"
+
+# Reference maps looked up by the model objects __post_init__, per parser.
+# Loading them up front keeps the parsers free of network calls.
+ANALYSIS_REFERENCE_DATA = ("weather_codes", "locations_info", "wind_directions")
+FORECAST_REFERENCE_DATA = ("weather_codes", "locations_info", "wind_directions")
+WARNINGS_REFERENCE_DATA = ("locations_info", "regions", "warnings_metadata")
+
+# Last parsed object per (kind, language, location), with the payload it was parsed from
+_parsed = {}
+_parsed_lock = threading.Lock()
+
+
+def memoized_parse(kind: str, language: str, location: str | None, data: dict, parse):
+    """
+    Parse a payload once: as long as the cache hands out the same payload object,
+    the model object parsed from it is returned again instead of being rebuilt.
+    The model objects are frozen, with tuples for their sequences, so sharing them between callers is safe.
+    parameters:
+        >>> kind: name of the parsed payload, e.g. "forecast"
+        >>> language, location: what the result depends on besides the payload
+        >>> data: the payload, as returned by the response cache
+        >>> parse: callable building the model object out of data
+    """
+    key = (kind, language, location)
+    with _parsed_lock:
+        parsed = _parsed.get(key)
+    if parsed is not None and parsed[0] is data:
+        return parsed[1]
+    result = parse(data)
+    if result is not None:
+        with _parsed_lock:
+            _parsed[key] = (data, result)
+    return result
+
+
+def clear_parsed_cache():
+    """
+    Forget every memoized model object, e.g. after the reference maps were reloaded
+    """
+    with _parsed_lock:
+        _parsed.clear()
+
+
+def parse_current_analysis(language: str, location: str, data: dict):
+    """
+    Build the Weather object for the given location out of the now_analysis data
+    return: Weather object or None when the location is missing from the data
+    """
+    analysis_data = data.get(location, {})
+    if not analysis_data:
+        logger.error('No "' + location + '" in current analysis response')
+        logger.debug("Response: " + str(analysis_data))
+        return None
+
+    logger.debug("Got current analysis for location " + str(location))
+    # Parse forecast_time and modified_at separately due to datetime parsing
+    forecast_time_str = get_value(
+        analysis_data, "forecast_time", None, str
+    )
+    forecast_time = (
+        consts.TIMEZONE.localize(
+            datetime.strptime(forecast_time_str, "%Y-%m-%d %H:%M:%S")
+        )
+        if forecast_time_str
+        else None
+    )
+
+    modified_at_str = get_value(analysis_data, "modified", None, str)
+    modified_at = (
+        consts.TIMEZONE.localize(
+            datetime.strptime(modified_at_str, "%Y-%m-%d %H:%M:%S")
+        )
+        if modified_at_str
+        else None
+    )
+
+    return Weather(
+        language=language,
+        lid=get_value(analysis_data, "lid", None, str),
+        humidity=get_value(
+            analysis_data, "relative_humidity", None, int, 0
+        ),
+        rain=get_value(analysis_data, "rain", None, float, 0.0, -999.0),
+        rain_chance=get_value(analysis_data, "rain_chance", None, int, 0),
+        temperature=get_value(
+            analysis_data, "temperature", None, float, 0.0
+        ),
+        due_point_temp=get_value(
+            analysis_data, "due_point_Temp", None, int, 0
+        ),
+        wind_speed=get_value(analysis_data, "wind_speed", None, int, 0),
+        wind_chill=get_value(analysis_data, "wind_chill", None, int, 0),
+        wind_direction_id=get_value(
+            analysis_data, "wind_direction_id", None, int, 0
+        ),
+        feels_like=get_value(
+            analysis_data, "feels_like", None, float
+        ),
+        heat_stress_level=get_value(
+            analysis_data, "heat_stress_level", None, int, 0
+        ),
+        u_v_index=get_value(analysis_data, "u_v_index", None, int, 0),
+        u_v_level=get_value(analysis_data, "u_v_level", None, str),
+        u_v_i_max=get_value(analysis_data, "u_v_i_max", None, int),
+        u_v_i_factor=get_value(analysis_data, "u_v_i_factor", None, float),
+        wave_height=get_value(
+            analysis_data, "wave_height", None, float, 0.0
+        ),
+        max_temp=get_value(analysis_data, "max_temp", None, int),
+        min_temp=get_value(analysis_data, "min_temp", None, int),
+        pm10=get_value(analysis_data, "pm10", None, int, 0),
+        forecast_time=forecast_time,
+        modified_at=modified_at,
+        json=analysis_data,
+        weather_code=get_value(analysis_data, "weather_code", None, int),
+        gust_speed=get_value(analysis_data, "gust_speed", None, int, None, -999)
+    )
+
+
+def parse_forecast(language: str, forecast_data: dict) -> Forecast:
+    """
+    Build the Forecast object out of the full_forecast_data data
+    """
+    days = []
+    for key in forecast_data.keys():
+        hours = _parse_hourly_forecast(
+            language, get_value(forecast_data, key, HOURLY_KEY, dict)
+        )
+        daily = Daily(
+            language=language,
+            date=consts.TIMEZONE.localize(datetime.strptime(key, "%Y-%m-%d")),
+            lid=get_value(
+                forecast_data[key], DAILY_KEY, "lid", default_value="0"
+            ),
+            weather_code=get_value(
+                forecast_data[key], DAILY_KEY, "weather_code", int
+            ),
+            minimum_temperature=get_value(
+                forecast_data[key], DAILY_KEY, "minimum_temperature", int
+            ),
+            maximum_temperature=get_value(
+                forecast_data[key], DAILY_KEY, "maximum_temperature", int
+            ),
+            maximum_uvi=get_value(
+                forecast_data[key], DAILY_KEY, "maximum_uvi", int
+            ),
+            u_v_i_factor=get_value(
+                forecast_data[key], "daily", "u_v_i_factor", float
+            ),
+            hours=hours,
+            description=(
+                get_value(
+                    forecast_data[key],
+                    "country",
+                    "description",
+                    default_value="",
+                )
+            ).rstrip(),
+        )
+        days.append(daily)
+    return Forecast(tuple(days))
+
+
+def _parse_hourly_forecast(language: str, data: dict):
+    """
+    Get the hourly forecast
+    """
+    hours = []
+    try:
+        for key in data.keys():
+            hours.append(
+                Hourly(
+                    language=language,
+                    hour=key,
+                    forecast_time=consts.TIMEZONE.localize(
+                        datetime.strptime(
+                            data.get(key, {}).get("forecast_time"),
+                            "%Y-%m-%d %H:%M:%S",
+                        )
+                    ),
+                    created=consts.TIMEZONE.localize(
+                        datetime.strptime(
+                            data.get(key, {}).get("created"), "%Y-%m-%d %H:%M:%S"
+                        )
+                    ),
+                    weather_code=get_value(data, key, "weather_code", int),
+                    temperature=get_value(data, key, "temperature", int),
+                    precise_temperature=get_value(
+                        data, key, "precise_temperature", float
+                    ),
+                    heat_stress=get_value(data, key, "heat_stress", float),
+                    heat_stress_level=get_value(
+                        data, key, "heat_stress_level", int
+                    ),
+                    pm10=get_value(data, key, "pm10", int),
+                    relative_humidity=get_value(
+                        data, key, "relative_humidity", int
+                    ),
+                    rain=get_value(data, key, "rain", float, None, -999.0),
+                    rain_chance=get_value(data, key, "rain_chance", int),
+                    wind_speed=get_value(data, key, "wind_speed", int),
+                    gust_speed=get_value(data, key, "gust_speed", int, None, -999),
+                    wind_direction_id=get_value(
+                        data, key, "wind_direction_id", int
+                    ),
+                    wave_height=get_value(data, key, "wave_height", float),
+                    wind_chill=get_value(data, key, "wind_chill", int),
+                    u_v_index=get_value(data, key, "u_v_index", int, None, -8991),
+                    u_v_i_max=get_value(data, key, "u_v_i_max", int),
+                )
+            )
+        return hours
+    except Exception as e:
+        logger.error("Error getting hourly forecast ")
+        logger.exception(e)
+        return None
+
+
+def parse_radar_images(data: dict) -> RadarSatellite:
+    """
+    Build the RadarSatellite object out of the radar_satellite data
+    """
+    rs = RadarSatellite([], [], [], [])
+    base_url = IMS_API_URL_BASE.format(language="").rstrip("/")
+    for key in data.get("types").get("IMSRadar"):
+        rs.imsradar_images.append(base_url + key.get("file_name"))
+
+    for key in data.get("types").get("radar"):
+        rs.radar_images.append(base_url + key.get("file_name"))
+
+    for key in data.get("types").get("MIDDLE-EAST"):
+        rs.middle_east_satellite_images.append(
+            base_url + key.get("file_name")
+        )
+
+    for key in data.get("types").get("EUROPE"):
+        rs.europe_satellite_images.append(base_url + key.get("file_name"))
+
+    logger.debug(f"\
+        Got: {len(rs.imsradar_images)} IMS Radar Images;\
+        {len(rs.radar_images)} Radar Images;\
+        {len(rs.middle_east_satellite_images)} Middle East Satellite Images;\
+        {len(rs.europe_satellite_images)} European Satellite Images")
+    return rs
+
+
+def parse_warnings(language: str, location: str, full_warnings_data: dict) -> list:
+    """
+    Build the list of Warning objects for the region of the given location
+    """
+    location_info = get_location_info_by_id(language, location)
+    if not location_info:
+        raise ValueError(f"Location not found for id {location}")
+
+    rid = location_info.get('rid')
+    region = get_region_by_id(language, region_id="r-" + rid)
+    if not region:
+        raise ValueError(f"Region not found for id {rid}")
+
+    warnings = []
+    if full_warnings_data:
+        for key in full_warnings_data[FULL_WARNINGS_DATA_KEY]:
+            daily_warnings: dict = get_value(full_warnings_data, FULL_WARNINGS_DATA_KEY, key, dict)
+            regional_alerts = daily_warnings.get("r-" + rid, {})
+            for alert in regional_alerts.values():
+
+                warnings.append(Warning(
+                    language=language,
+                    location_id=int(location),
+                        wid=int(alert["wid"]),
+                        alert_id=int(alert["alert_id"]),
+                        severity_id=int(alert["severity_id"]),
+                        warning_type_id=int(alert["warning_type_id"]),
+                        sent=alert["sent"],
+                        valid_from=alert["valid_from"],
+                        valid_to=alert["valid_to"],
+                        full_en=alert["full_en"],
+                        full_he=alert["full_he"],
+                        text=alert["text"],
+                        text_full=alert["text_full"],
+                        valid_from_unix=int(alert["valid_from_unix"]),
+                        groups=alert["groups"],
+                        regions=alert["regions"]
+                ))
+
+    return warnings
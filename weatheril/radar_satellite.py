@@ -1,12 +1,15 @@
 from __future__ import annotations
 import os
 import tempfile
-import requests
-from PIL import Image
 from loguru import logger
 from urllib.parse import urlparse
 from dataclasses import dataclass
 
+from .compression import record_response
+from .rate_limit import acquire_request_slot
+from .resilience import call_with_retries, get_request_timeout
+from .transport import get_transport
+
 
 @dataclass
 class RadarSatellite:
@@ -44,6 +47,9 @@ class RadarSatellite:
             >>> images: the list of images for creating the animation.
         """
         try:
+            # Pillow is only needed here, importing it with the package would slow every startup
+            from PIL import Image
+
             if os.path.exists(path):
                 animated_image_path = path + "/" + animated_file
             else:
@@ -54,8 +60,9 @@ class RadarSatellite:
                 "Creating " + animated_file + " animation at: " + animated_image_path
             )
 
+            transport = get_transport()
             for idx, item in enumerate(images):
-                file = requests.get(images[idx])
+                file = call_with_retries(images[idx], lambda: download_image(transport, images[idx]))
                 open(
                     tempfile.gettempdir()
                     + "/"
@@ -85,3 +92,15 @@ class RadarSatellite:
         except Exception as e:
             logger.error("Error creating " + animated_file + " animation. " + str(e))
             return None
+
+
+def download_image(transport, url: str):
+    """
+    Download a radar / satellite image frame, within the request rate limit.
+    Raises on http errors, so call_with_retries retries 429 / 5xx and no error page is opened as an image
+    """
+    acquire_request_slot(url)
+    response = transport.get(url, timeout=get_request_timeout())
+    record_response(url, response)
+    response.raise_for_status()
+    return response
@@ -0,0 +1,156 @@
+"""Process-wide token bucket limiting the rate of calls to IMS, serving waiting calls by priority"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+from .cache_policy import endpoint_of
+
+# Priority classes, lower is served first
+PRIORITY_ANALYSIS = 0
+PRIORITY_FORECAST = 1
+PRIORITY_WARNINGS = 2
+PRIORITY_RADAR = 3
+
+# Priority per IMS endpoint. The reference data is needed to parse anything, so it goes with the analysis.
+# Other urls (radar and satellite image frames) get PRIORITY_RADAR.
+ENDPOINT_PRIORITY = {
+    "now_analysis": PRIORITY_ANALYSIS,
+    "weather_codes": PRIORITY_ANALYSIS,
+    "locations_info": PRIORITY_ANALYSIS,
+    "wind_directions": PRIORITY_ANALYSIS,
+    "regions": PRIORITY_ANALYSIS,
+    "sea_regions": PRIORITY_ANALYSIS,
+    "warnings_metadata": PRIORITY_ANALYSIS,
+    "full_forecast_data": PRIORITY_FORECAST,
+    "warnings": PRIORITY_WARNINGS,
+    "radar_satellite": PRIORITY_RADAR,
+}
+
+# Longest sleep of a waiting call between two looks at the bucket
+MAX_WAIT_INTERVAL = 0.05
+
+
+class RateLimiter:
+    """
+    Token bucket shared by threads and event loops: rate tokens are added per second, up to burst.
+    Every call takes a token; when none is left, calls wait and the highest priority waiter
+    (then the oldest) gets the next token.
+    parameters:
+        >>> rate: sustained requests per second
+        >>> burst: most requests sent at once after a quiet period. default is rate (at least 1)
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._waiters = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def acquire(self, priority: int = PRIORITY_RADAR):
+        """
+        Block until a token is available for this call
+        """
+        ticket = self._enqueue(priority)
+        try:
+            with self._condition:
+                while True:
+                    delay = self._take(ticket)
+                    if delay == 0:
+                        return
+                    self._condition.wait(delay)
+        except BaseException:
+            self._dequeue(ticket)
+            raise
+
+    async def async_acquire(self, priority: int = PRIORITY_RADAR):
+        """
+        Wait, without blocking the event loop, until a token is available for this call
+        """
+        ticket = self._enqueue(priority)
+        try:
+            while True:
+                with self._condition:
+                    delay = self._take(ticket)
+                if delay == 0:
+                    return
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._dequeue(ticket)
+            raise
+
+    def _enqueue(self, priority: int) -> tuple:
+        ticket = (priority, next(self._counter))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+        return ticket
+
+    def _dequeue(self, ticket: tuple):
+        with self._condition:
+            if ticket in self._waiters:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def _take(self, ticket: tuple) -> float:
+        """
+        Take a token for ticket if it is first in line, called with the condition held.
+        return: 0 when taken, otherwise the seconds to wait before trying again
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        if self._waiters[0] != ticket:
+            return MAX_WAIT_INTERVAL
+        if self._tokens >= 1:
+            self._tokens -= 1
+            heapq.heappop(self._waiters)
+            # The next waiter in line may be able to go too
+            self._condition.notify_all()
+            return 0
+        return min(MAX_WAIT_INTERVAL, (1 - self._tokens) / self.rate)
+
+
+_rate_limiter = None
+
+
+def set_rate_limit(requests_per_sec: float | None, burst: float | None = None):
+    """
+    Limit the calls to IMS (api calls, retries, reference data and radar image frames) to requests_per_sec,
+    with bursts of up to burst calls. None removes the limit, the default.
+    """
+    global _rate_limiter
+    _rate_limiter = RateLimiter(requests_per_sec, burst) if requests_per_sec else None
+
+
+def get_rate_limiter() -> RateLimiter | None:
+    return _rate_limiter
+
+
+def priority_of(url: str) -> int:
+    """
+    Priority class of a call to the url, see ENDPOINT_PRIORITY
+    """
+    return ENDPOINT_PRIORITY.get(endpoint_of(url), PRIORITY_RADAR)
+
+
+def acquire_request_slot(url: str):
+    """
+    Wait for the rate limiter, if one is set, before calling the url
+    """
+    limiter = _rate_limiter
+    if limiter is not None:
+        limiter.acquire(priority_of(url))
+
+
+async def async_acquire_request_slot(url: str):
+    """
+    Asyncio version of acquire_request_slot
+    """
+    limiter = _rate_limiter
+    if limiter is not None:
+        await limiter.async_acquire(priority_of(url))
@@ -0,0 +1,205 @@
+"""Local in-process server speaking the Redis protocol (RESP), standing in for Redis in the RedisCacheBackend tests"""
+import fnmatch
+import threading
+import time
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+
+from loguru import logger
+
+from .cache import RedisCacheBackend
+
+
+class RedisStandInError(Exception):
+    """
+    Error replied to the client as a RESP error
+    """
+
+
+class RedisStandInServer:
+    """
+    Keep string keys in memory and answer the commands RedisCacheBackend sends: GET, SET (EX / PX),
+    TTL, PTTL, DEL, SCAN (MATCH / COUNT), SELECT, AUTH, PING and FLUSHDB, with expiring keys like Redis.
+    Use backend() to get a RedisCacheBackend connected to it:
+        >>> with RedisStandInServer() as server:
+        >>>     set_cache_backend(server.backend())
+    parameters:
+        >>> password: required with AUTH before any other command when provided
+        >>> host, port: address to listen on. port 0 picks a free port
+    """
+
+    def __init__(self, password: str | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.password = password
+        self.commands = 0
+        # {db: {key: (value, expires_at or None)}}, expires_at on the time.monotonic() clock
+        self._databases = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingTCPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self) -> tuple:
+        return self._server.server_address[:2]
+
+    def backend(self, **kwargs) -> RedisCacheBackend:
+        """
+        RedisCacheBackend connected to this server, kwargs (db, prefix, timeout...) are passed on
+        """
+        host, port = self.address
+        return RedisCacheBackend(host=host, port=port, password=self.password, **kwargs)
+
+    def start(self) -> "RedisStandInServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="weatheril-redis-standin", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Redis stand-in server listening on " + ":".join(map(str, self.address)))
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _live_keys(self, db: int) -> dict:
+        """
+        The keys of a database, expired keys removed first. Called with the lock held
+        """
+        keys = self._databases.setdefault(db, {})
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in keys.items() if expires_at is not None and expires_at <= now]:
+            del keys[key]
+        return keys
+
+    def _execute(self, connection: dict, args: list):
+        """
+        Run one command for a connection ({"db": int, "authenticated": bool})
+        return: the reply, see _encode_reply
+        """
+        name = args[0].decode().upper()
+        with self._lock:
+            self.commands += 1
+        if name == "AUTH":
+            if self.password is None or args[-1].decode() != self.password:
+                raise RedisStandInError("WRONGPASS invalid username-password pair")
+            connection["authenticated"] = True
+            return "OK"
+        if self.password is not None and not connection["authenticated"]:
+            raise RedisStandInError("NOAUTH Authentication required.")
+        if name == "PING":
+            return "PONG"
+        if name == "SELECT":
+            connection["db"] = int(args[1])
+            return "OK"
+
+        with self._lock:
+            keys = self._live_keys(connection["db"])
+            if name == "GET":
+                item = keys.get(args[1])
+                return None if item is None else item[0]
+            if name == "SET":
+                expires_at = None
+                options = [arg.decode().upper() for arg in args[3::2]]
+                for option, value in zip(options, args[4::2]):
+                    if option == "EX":
+                        expires_at = time.monotonic() + int(value)
+                    elif option == "PX":
+                        expires_at = time.monotonic() + int(value) / 1000
+                    else:
+                        raise RedisStandInError("ERR syntax error")
+                keys[args[1]] = (bytes(args[2]), expires_at)
+                return "OK"
+            if name in ("TTL", "PTTL"):
+                item = keys.get(args[1])
+                if item is None:
+                    return -2
+                if item[1] is None:
+                    return -1
+                remaining = item[1] - time.monotonic()
+                return int(remaining * 1000) if name == "PTTL" else int(round(remaining))
+            if name == "DEL":
+                return sum(keys.pop(key, None) is not None for key in args[1:])
+            if name == "SCAN":
+                # The cursor is an offset in the sorted keys, good enough for the clients of the stand-in
+                pattern, count = "*", 10
+                for option, value in zip(args[2::2], args[3::2]):
+                    if option.decode().upper() == "MATCH":
+                        pattern = value.decode()
+                    elif option.decode().upper() == "COUNT":
+                        count = int(value)
+                start = int(args[1])
+                names = sorted(keys)
+                found = [key for key in names[start:start + count] if fnmatch.fnmatchcase(key.decode(), pattern)]
+                cursor = start + count if start + count < len(names) else 0
+                return [str(cursor).encode(), found]
+            if name == "FLUSHDB":
+                keys.clear()
+                return "OK"
+        raise RedisStandInError("ERR unknown command '" + name + "'")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(StreamRequestHandler):
+            def handle(self):
+                connection = {"db": 0, "authenticated": False}
+                while True:
+                    try:
+                        args = _read_command(self.rfile)
+                    except (ValueError, IndexError) as e:
+                        logger.debug("Redis stand-in server: bad request. " + str(e))
+                        return
+                    if args is None:
+                        return
+                    try:
+                        reply = server._execute(connection, args)
+                    except RedisStandInError as e:
+                        reply = e
+                    self.wfile.write(_encode_reply(reply))
+
+        return Handler
+
+
+def _read_command(reader) -> list | None:
+    """
+    Read one command sent as a RESP array of bulk strings
+    return: the arguments as bytes, None when the client closed the connection
+    """
+    line = reader.readline()
+    if not line:
+        return None
+    if line[:1] != b"*":
+        raise ValueError("Expected a RESP array, got " + repr(line))
+    args = []
+    for _ in range(int(line[1:-2])):
+        header = reader.readline()
+        if header[:1] != b"$":
+            raise ValueError("Expected a RESP bulk string, got " + repr(header))
+        args.append(reader.read(int(header[1:-2]) + 2)[:-2])
+    return args
+
+
+def _encode_reply(reply) -> bytes:
+    """
+    RESP encoding of a reply: str is a simple string, bytes a bulk string, None a null bulk string,
+    int an integer, list an array and RedisStandInError an error
+    """
+    if isinstance(reply, RedisStandInError):
+        return b"-" + str(reply).encode() + b"\r\n"
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, str):
+        return b"+" + reply.encode() + b"\r\n"
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, list):
+        return b"*%d\r\n" % len(reply) + b"".join(_encode_reply(item) for item in reply)
+    return b"$%d\r\n%s\r\n" % (len(reply), reply)
@@ -0,0 +1,252 @@
+"""Timeouts, retries, negative caching and per-endpoint circuit breakers for the calls to IMS"""
+import random
+import threading
+import time
+
+from loguru import logger
+
+from .cache_policy import endpoint_of
+
+DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_MAX_RETRY_BACKOFF = 5
+DEFAULT_NEGATIVE_CACHE_EXPIRATION = 10
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30
+
+_request_timeout = DEFAULT_REQUEST_TIMEOUT
+_retries = DEFAULT_RETRIES
+_retry_backoff = DEFAULT_RETRY_BACKOFF
+_max_retry_backoff = DEFAULT_MAX_RETRY_BACKOFF
+_negative_cache_expiration = DEFAULT_NEGATIVE_CACHE_EXPIRATION
+_failure_threshold = DEFAULT_FAILURE_THRESHOLD
+_recovery_timeout = DEFAULT_RECOVERY_TIMEOUT
+
+_negative_results = {}
+_negative_results_lock = threading.Lock()
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling IMS while the circuit breaker of the endpoint is open
+    """
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint after failure_threshold consecutive failures.
+    After recovery_timeout seconds a single trial call is let through: success closes the circuit,
+    failure keeps it open for another recovery_timeout.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                return "open"
+            return "half-open"
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go to IMS now
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.recovery_timeout or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+def set_request_timeout(seconds: float):
+    """
+    Set the timeout of every call to IMS, in seconds
+    """
+    global _request_timeout
+    _request_timeout = seconds
+
+
+def get_request_timeout() -> float:
+    return _request_timeout
+
+
+def configure_retries(
+    retries: int = DEFAULT_RETRIES,
+    backoff_in_sec: float = DEFAULT_RETRY_BACKOFF,
+    max_backoff_in_sec: float = DEFAULT_MAX_RETRY_BACKOFF,
+):
+    """
+    Set how failed calls to IMS are retried. Only timeouts, connection errors, 429 and 5xx responses are retried.
+    parameters:
+        >>> retries: extra attempts after the first one, 0 disables retrying
+        >>> backoff_in_sec: base of the exponential backoff, doubled on every attempt
+        >>> max_backoff_in_sec: cap of the backoff. the actual wait is a random time up to the backoff (full jitter)
+    """
+    global _retries, _retry_backoff, _max_retry_backoff
+    _retries = retries
+    _retry_backoff = backoff_in_sec
+    _max_retry_backoff = max_backoff_in_sec
+
+
+def get_retries() -> int:
+    return _retries
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Seconds to wait before retrying after the given (0 based) failed attempt
+    """
+    return random.uniform(0, min(_max_retry_backoff, _retry_backoff * 2 ** attempt))
+
+
+def is_retryable(error: Exception, connection_errors: tuple = (OSError,)) -> bool:
+    """
+    Whether a failed call is worth retrying: timeouts, connection errors, 429 and 5xx responses
+    parameters:
+        >>> error: the raised exception
+        >>> connection_errors: exception types of the http client meaning the server could not be reached
+    """
+    # requests HTTPError carries the response, aiohttp ClientResponseError the status
+    status = getattr(error, "status", None)
+    response = getattr(error, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return isinstance(error, connection_errors)
+
+
+def set_negative_cache_expiration(seconds: float):
+    """
+    Set how long a failed or empty IMS response is remembered, during which the url is not requested again
+    """
+    global _negative_cache_expiration
+    _negative_cache_expiration = seconds
+
+
+def remember_negative_result(url: str, error: Exception | None):
+    """
+    Remember that the url failed with error, or returned no data when error is None
+    """
+    if _negative_cache_expiration <= 0:
+        return
+    with _negative_results_lock:
+        _negative_results[url] = (time.monotonic() + _negative_cache_expiration, error)
+
+
+def get_negative_result(url: str) -> tuple | None:
+    """
+    The remembered (expires_at, error) of the url while it has not expired, otherwise None
+    """
+    with _negative_results_lock:
+        result = _negative_results.get(url)
+        if result is None:
+            return None
+        if result[0] <= time.monotonic():
+            del _negative_results[url]
+            return None
+        return result
+
+
+def forget_negative_result(url: str):
+    with _negative_results_lock:
+        _negative_results.pop(url, None)
+
+
+def configure_circuit_breaker(
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    recovery_timeout_in_sec: float = DEFAULT_RECOVERY_TIMEOUT,
+):
+    """
+    Set when the per-endpoint circuit breakers open, and how long they wait before letting a trial call through.
+    While a circuit is open the last good data of a url is served if there is one, otherwise CircuitOpenError is raised.
+    Resets the current circuit breakers.
+    """
+    global _failure_threshold, _recovery_timeout
+    _failure_threshold = failure_threshold
+    _recovery_timeout = recovery_timeout_in_sec
+    reset_circuit_breakers()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker of the endpoint of the url
+    """
+    endpoint = endpoint_of(url)
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(_failure_threshold, _recovery_timeout)
+            _circuit_breakers[endpoint] = breaker
+        return breaker
+
+
+def reset_circuit_breakers():
+    """
+    Close every circuit and forget the remembered failures
+    """
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
+    with _negative_results_lock:
+        _negative_results.clear()
+
+
+def record_outcome(url: str, error: Exception | None, connection_errors: tuple = (OSError,)):
+    """
+    Update the circuit breaker and the negative cache after a call to IMS (after its retries)
+    """
+    breaker = get_circuit_breaker(url)
+    if error is not None and is_retryable(error, connection_errors):
+        breaker.record_failure()
+        if breaker.state != "closed":
+            logger.warning("Circuit open for " + endpoint_of(url) + " after repeated failures")
+    else:
+        # Any answer, even a 404 for an unknown location, means IMS is up
+        breaker.record_success()
+    if error is not None:
+        remember_negative_result(url, error)
+
+
+def call_with_retries(url: str, fn):
+    """
+    Call fn, retrying it with jittered exponential backoff while it fails with a retryable error
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= _retries or not is_retryable(e):
+                raise
+            delay = retry_delay(attempt)
+            logger.warning("Retrying " + url + " in " + format(delay, ".2f") + " seconds. " + str(e))
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,101 @@
+"""Library-wide, connection-pooled HTTP session shared by every fetch path"""
+import threading
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from .compression import SYNC_ACCEPT_ENCODING
+
+# Number of distinct hosts to keep a connection pool for
+DEFAULT_POOL_CONNECTIONS = 4
+# Maximum number of connections kept alive per host
+DEFAULT_POOL_MAXSIZE = 32
+
+_session = None
+_owns_session = False
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a new requests session with a sized connection pool.
+    parameters:
+        >>> pool_connections: number of per-host pools to cache
+        >>> pool_maxsize: maximum number of connections to keep open per host
+        >>> pool_block: block when the per-host pool is exhausted instead of opening extra connections
+        >>> keep_alive: reuse connections between requests (disable to send "Connection: close")
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Ask for every compression urllib3 can decode (brotli / zstd when their packages are installed)
+    session.headers["Accept-Encoding"] = SYNC_ACCEPT_ENCODING
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared session, creating it with the default settings on first use
+    """
+    global _session, _owns_session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+                _owns_session = True
+    return _session
+
+
+def set_session(session: requests.Session):
+    """
+    Replace the shared session with a caller provided one.
+    The previous session is not closed, the caller owns injected sessions.
+    """
+    _replace_session(session, owned=False)
+
+
+def configure_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Replace the shared session with a new one using the given pool settings
+    """
+    session = create_session(pool_connections, pool_maxsize, pool_block, keep_alive)
+    _replace_session(session, owned=True)
+    return session
+
+
+def close_session():
+    """
+    Close the shared session and release its pooled connections
+    """
+    _replace_session(None, owned=False)
+
+
+def _replace_session(session, owned: bool):
+    """
+    Swap the shared session, closing the previous one only if it was created here
+    """
+    global _session, _owns_session
+    with _session_lock:
+        previous, previous_owned = _session, _owns_session
+        _session, _owns_session = session, owned
+    if previous is not None and previous_owned:
+        logger.debug("Closing previous shared session")
+        previous.close()
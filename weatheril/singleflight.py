@@ -0,0 +1,126 @@
+"""Coalesce concurrent identical calls, or initializations, so only one of them does the work"""
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe call deduplication: while a call for a key is running,
+    other callers asking for the same key wait for it and share its result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio call deduplication: concurrent callers awaiting the same key share one task.
+    A caller being cancelled does not cancel the shared task for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, coro_fn):
+        # Tasks are bound to their event loop, so calls are only shared within a loop
+        key = (id(asyncio.get_running_loop()), key)
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+
+class KeyedOnce:
+    """
+    Thread-safe lazy initialization per key: the first caller for a key runs the initializer
+    while concurrent callers for the same key wait for it, then everyone reads the stored value without locking.
+    Falsy results (a failed load) are not stored, so the next caller tries again.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, init):
+        value = self._values.get(key)
+        if value:
+            return value
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self._values.get(key)
+            if value:
+                return value
+            value = init()
+            if value:
+                # Under the lock of the dict too, so discard and keys never see it change size
+                with self._lock:
+                    self._values[key] = value
+            return value
+
+    def peek(self, key):
+        """
+        The stored value of the key, None when not initialized yet
+        """
+        return self._values.get(key)
+
+    def set(self, key, value):
+        """
+        Store a value initialized elsewhere, e.g. fetched asynchronously
+        """
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock, self._lock:
+            self._values[key] = value
+
+    def keys(self) -> list:
+        """
+        The initialized keys
+        """
+        with self._lock:
+            return list(self._values)
+
+    def discard(self, predicate=None):
+        """
+        Forget the keys matching predicate (all of them when None), they are initialized again on next get
+        """
+        with self._lock:
+            for key in [key for key in self._values if predicate is None or predicate(key)]:
+                self._values.pop(key, None)
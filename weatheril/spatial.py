@@ -0,0 +1,194 @@
+"""Nearest location and radius queries over the locations_info reference map, with a KD-tree"""
+import heapq
+import math
+import threading
+
+from .utils import get_reference_map
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Index of each language, with the locations map it was built from: rebuilt when the map is refreshed
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _to_point(lat: float, lon: float) -> tuple:
+    """
+    Point of the unit sphere: the straight-line distance between two points ranks like the great-circle distance
+    """
+    lat, lon = math.radians(lat), math.radians(lon)
+    cos_lat = math.cos(lat)
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat)
+
+
+def _chord_to_km(squared_chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(squared_chord) / 2))
+
+
+def _km_to_chord(distance_km: float) -> float:
+    return 2 * math.sin(min(distance_km / EARTH_RADIUS_KM, math.pi) / 2)
+
+
+class LocationIndex:
+    """
+    KD-tree over the locations coordinates, built once and queried for any number of points.
+    Distances are great-circle distances in km.
+    parameters:
+        >>> locations: {lid: location info} with "lat" and "lon", like the locations_info reference map.
+                       Locations without valid coordinates are left out.
+    """
+
+    def __init__(self, locations: dict):
+        self.locations = []
+        self._points = []
+        for location in locations.values():
+            try:
+                point = _to_point(float(location["lat"]), float(location["lon"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.locations.append(location)
+            self._points.append(point)
+        self._tree = self._build(list(range(len(self._points))), 0)
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def _build(self, indexes: list, depth: int):
+        """
+        Node (point index, axis, left subtree, right subtree), split on the median of the axis, None for an empty tree
+        """
+        if not indexes:
+            return None
+        axis = depth % 3
+        indexes.sort(key=lambda index: self._points[index][axis])
+        median = len(indexes) // 2
+        return (
+            indexes[median],
+            axis,
+            self._build(indexes[:median], depth + 1),
+            self._build(indexes[median + 1:], depth + 1),
+        )
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> list:
+        """
+        The k locations nearest to a point
+        return: list of (location info, distance in km), nearest first
+        """
+        if k < 1:
+            return []
+        target = _to_point(lat, lon)
+        heap = []
+        self._search_nearest(self._tree, target, k, heap)
+        found = sorted((-squared_chord, index) for squared_chord, index in heap)
+        return [(self.locations[index], _chord_to_km(squared_chord)) for squared_chord, index in found]
+
+    def _search_nearest(self, node, target: tuple, k: int, heap: list):
+        # heap holds the best k as (-squared distance, index), the farthest of them on top
+        if node is None:
+            return
+        index, axis, left, right = node
+        point = self._points[index]
+        squared_chord = (
+            (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+        )
+        if len(heap) < k:
+            heapq.heappush(heap, (-squared_chord, index))
+        elif squared_chord < -heap[0][0]:
+            heapq.heapreplace(heap, (-squared_chord, index))
+        difference = target[axis] - point[axis]
+        near, far = (left, right) if difference < 0 else (right, left)
+        self._search_nearest(near, target, k, heap)
+        # The far side can only hold closer points when the splitting plane is closer than the current k-th
+        if len(heap) < k or difference * difference < -heap[0][0]:
+            self._search_nearest(far, target, k, heap)
+
+    def within(self, lat: float, lon: float, radius_km: float) -> list:
+        """
+        The locations at most radius_km from a point
+        return: list of (location info, distance in km), nearest first
+        """
+        if radius_km < 0:
+            return []
+        target = _to_point(lat, lon)
+        max_chord = _km_to_chord(radius_km)
+        found = []
+        self._search_within(self._tree, target, max_chord * max_chord, found)
+        found.sort()
+        return [(self.locations[index], _chord_to_km(squared_chord)) for squared_chord, index in found]
+
+    def _search_within(self, node, target: tuple, max_squared_chord: float, found: list):
+        if node is None:
+            return
+        index, axis, left, right = node
+        point = self._points[index]
+        squared_chord = (
+            (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+        )
+        if squared_chord <= max_squared_chord:
+            found.append((squared_chord, index))
+        difference = target[axis] - point[axis]
+        if difference < 0 or difference * difference <= max_squared_chord:
+            self._search_within(left, target, max_squared_chord, found)
+        if difference >= 0 or difference * difference <= max_squared_chord:
+            self._search_within(right, target, max_squared_chord, found)
+
+
+def get_location_index(language: str = "he") -> LocationIndex:
+    """
+    The index of the locations of a language, built on first use from the locations_info reference map
+    (or its fallback table) and rebuilt after the map is refreshed
+    """
+    locations = get_reference_map(language, "locations_info") or {}
+    indexed = _indexes.get(language)
+    if indexed is not None and indexed[0] is locations:
+        return indexed[1]
+    index = LocationIndex(locations)
+    with _indexes_lock:
+        _indexes[language] = (locations, index)
+    return index
+
+
+def nearest_location(lat: float, lon: float, k: int = 1, language: str = "he") -> list:
+    """
+    The k locations nearest to a point, e.g. a GPS position
+    parameters:
+        >>> lat, lon: coordinates of the point, in degrees
+        >>> k: number of locations to return
+        >>> language: language of the location names
+    return: list of (location info, distance in km), nearest first
+    """
+    return get_location_index(language).nearest(lat, lon, k)
+
+
+def locations_within(lat: float, lon: float, radius_km: float, language: str = "he") -> list:
+    """
+    The locations at most radius_km from a point
+    parameters:
+        >>> lat, lon: coordinates of the point, in degrees
+        >>> radius_km: radius around the point, in km
+        >>> language: language of the location names
+    return: list of (location info, distance in km), nearest first
+    """
+    return get_location_index(language).within(lat, lon, radius_km)
+
+
+def nearest_location_batch(points, k: int = 1, language: str = "he") -> list:
+    """
+    nearest_location for many points at once, all queried on the same index
+    parameters:
+        >>> points: iterable of (lat, lon)
+    return: one nearest_location result per point, in order
+    """
+    index = get_location_index(language)
+    return [index.nearest(lat, lon, k) for lat, lon in points]
+
+
+def locations_within_batch(points, radius_km: float, language: str = "he") -> list:
+    """
+    locations_within for many points at once, all queried on the same index
+    parameters:
+        >>> points: iterable of (lat, lon)
+    return: one locations_within result per point, in order
+    """
+    index = get_location_index(language)
+    return [index.within(lat, lon, radius_km) for lat, lon in points]
@@ -0,0 +1,111 @@
+"""Local HTTP server standing in for ims.gov.il, serving recorded responses, for offline performance tests"""
+import gzip
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loguru import logger
+
+from .transport import RedirectTransport, load_recording
+
+
+class StandInServer:
+    """
+    Serve the responses recorded by RecordingTransport (full_forecast_data, now_analysis, warnings,
+    radar_satellite, the reference data and the radar / satellite images) by their ims.gov.il path.
+    Use transport() to send the library requests to it, from WeatherIL and AsyncWeatherIL alike:
+        >>> with StandInServer("recordings", latency=0.05) as server:
+        >>>     set_transport(server.transport())
+    parameters:
+        >>> directory: directory of the recordings
+        >>> latency: seconds to wait before answering every request, to simulate the network
+        >>> content_encoding: "gzip" or "deflate" to compress the responses for clients accepting it, like IMS may do
+        >>> host, port: address to listen on. port 0 picks a free port
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        latency: float = 0.0,
+        content_encoding: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if content_encoding not in (None, "gzip", "deflate"):
+            raise ValueError("Unsupported content encoding: " + content_encoding)
+        self.directory = directory
+        self.latency = latency
+        self.content_encoding = content_encoding
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return "http://" + host + ":" + str(port) + "/"
+
+    def transport(self) -> RedirectTransport:
+        """
+        Transport sending the requests for ims.gov.il to this server
+        """
+        return RedirectTransport(self.base_url)
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="weatheril-standin", daemon=True)
+        self._thread.start()
+        logger.debug("Stand-in server listening on " + self.base_url)
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                response = load_recording(server.directory, self.path)
+                if response is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = response.content
+                encoding = server.content_encoding
+                if encoding and encoding in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body) if encoding == "gzip" else zlib.compress(body)
+                else:
+                    encoding = None
+                self.send_response(response.status_code)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Stand-in server: " + format % args)
+
+        return Handler
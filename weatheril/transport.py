@@ -0,0 +1,191 @@
+"""Pluggable transport under every sync call to IMS, with recording and replaying of responses"""
+import json
+import os
+from urllib.parse import quote, urlparse
+
+import requests
+from loguru import logger
+from requests.structures import CaseInsensitiveDict
+
+from .consts import IMS_API_URL_BASE
+from .session import get_session
+
+IMS_BASE_URL = IMS_API_URL_BASE.format(language="").rstrip("/") + "/"
+# Headers describing the wire format, which no longer apply to a recorded (decoded) body
+_WIRE_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive")
+
+_transport = None
+
+
+class Transport:
+    """
+    Anything sending the GET requests of the library: an object with
+    get(url, headers=None, timeout=None) returning a requests.Response like object
+    (status_code, headers, content, text, raise_for_status).
+    A requests.Session is a Transport, the shared session is the default one.
+    """
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | None = None):
+        ...
+
+
+class RecordedResponse:
+    """
+    Response replayed from a recording, with the parts of requests.Response the library uses
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(str(self.status_code) + " Error for url: " + self.url, response=self)
+
+
+def recording_name(url: str) -> str:
+    """
+    File name (without extension) of the recording of a url: its quoted path and query,
+    so recordings of ims.gov.il can be served back by path
+    """
+    parsed = urlparse(url)
+    path = parsed.path + ("?" + parsed.query if parsed.query else "")
+    return quote(path, safe="")
+
+
+def save_recording(directory: str, url: str, status_code: int, headers, content: bytes):
+    """
+    Write a response as <name>.json (url, status and headers) and <name>.body (the raw body)
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = os.path.join(directory, recording_name(url))
+    meta = {
+        "url": url,
+        "status_code": status_code,
+        "headers": {key: value for key, value in headers.items() if key.lower() not in _WIRE_HEADERS},
+    }
+    with open(name + ".body", "wb") as f:
+        f.write(content)
+    with open(name + ".json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+def load_recording(directory: str, url: str) -> RecordedResponse | None:
+    """
+    Read the recorded response of a url, None when it was not recorded
+    """
+    name = os.path.join(directory, recording_name(url))
+    try:
+        with open(name + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(name + ".body", "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    return RecordedResponse(url, meta["status_code"], meta["headers"], content)
+
+
+class RecordingTransport(Transport):
+    """
+    Send the requests through another transport and save every response to a directory,
+    to be replayed later by ReplayTransport or StandInServer.
+    parameters:
+        >>> directory: where the recordings are written, created if missing
+        >>> transport: transport actually sending the requests. default is the shared session
+    """
+
+    def __init__(self, directory: str, transport: Transport | None = None):
+        self.directory = directory
+        self.transport = transport
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | None = None):
+        # Conditional headers are not forwarded, a 304 would leave nothing to record
+        response = (self.transport or get_session()).get(url, timeout=timeout)
+        try:
+            save_recording(self.directory, url, response.status_code, response.headers, response.content)
+        except OSError as e:
+            logger.error("Error recording " + url + ". " + str(e))
+        return response
+
+
+class ReplayTransport(Transport):
+    """
+    Answer every request from the recordings of a directory, without network.
+    Urls that were not recorded get a 404.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | None = None):
+        response = load_recording(self.directory, url)
+        if response is None:
+            logger.debug("No recording for " + url)
+            return RecordedResponse(url, 404, {}, b"")
+        return response
+
+
+class RedirectTransport(Transport):
+    """
+    Send the requests for ims.gov.il to another server, e.g. a StandInServer
+    parameters:
+        >>> base_url: replaces "https://ims.gov.il/" in the requested urls
+        >>> transport: transport sending the redirected requests. default is the shared session
+    """
+
+    def __init__(self, base_url: str, transport: Transport | None = None):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.transport = transport
+
+    def redirect(self, url: str) -> str:
+        """
+        The url actually requested for url
+        """
+        if url.startswith(IMS_BASE_URL):
+            return self.base_url + url[len(IMS_BASE_URL):]
+        return url
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | None = None):
+        return (self.transport or get_session()).get(self.redirect(url), headers=headers, timeout=timeout)
+
+
+def set_transport(transport: Transport | None):
+    """
+    Send the library requests through transport. None goes back to the shared session.
+    """
+    global _transport
+    _transport = transport
+
+
+def get_transport() -> Transport:
+    """
+    Get the transport of the library requests: the one set with set_transport, or the shared session
+    """
+    return _transport if _transport is not None else get_session()
+
+
+def find_transport(kind: type, transport: Transport | None = None):
+    """
+    The first transport of a kind in the chain of the current transport (or of transport), following the transports
+    wrapped by RecordingTransport and RedirectTransport. None when there is none.
+    The async client, which sends its requests with aiohttp, applies the transport set with set_transport this way.
+    """
+    transport = transport if transport is not None else get_transport()
+    while transport is not None:
+        if isinstance(transport, kind):
+            return transport
+        transport = getattr(transport, "transport", None)
+    return None
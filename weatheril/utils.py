@@ -1,37 +1,53 @@
-import json
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Type, Optional
 
 import requests
 from loguru import logger
-from weatheril.consts import EN_LOCATIONS, EN_WEATHER_CODES, EN_WIND_DIRECTIONS, HE_LOCATIONS, HE_WEATHER_CODES, HE_WIND_DIRECTIONS, LOCATIONS_INFO_URL, WARNINGS_METADTA_URL, WEATHER_CODES_URL, WIND_DIRECTIONS_URL, WEEKDAY_NAMES
+from weatheril import consts
+from weatheril.consts import LOCATIONS_INFO_URL, WARNINGS_METADTA_URL, WEATHER_CODES_URL, WIND_DIRECTIONS_URL, WEEKDAY_NAMES
 from weatheril.consts import REGIONS_URL
 from weatheril.consts import SEA_REGIONS_URL
+from weatheril.cache import CacheEntry, body_fingerprint, get_response_cache
+from weatheril.cache_policy import endpoint_of, entry_expiration, max_age_from_headers, observe_publication, published_at_of
+from weatheril.consts import DEFAULT_MAX_STALENESS, CONDITIONAL_REQUEST_RETENTION, REFERENCE_DATA_CACHE_EXPIRATION
+from weatheril.resilience import CircuitOpenError, call_with_retries, get_circuit_breaker, get_negative_result
+from weatheril.resilience import get_request_timeout, record_outcome, remember_negative_result
+from weatheril import json_backend
+from weatheril.compression import record_response
+from weatheril.rate_limit import acquire_request_slot
+from weatheril.transport import get_transport
+from weatheril.singleflight import KeyedOnce, SingleFlight
 
 # ims.gov.il does not support ipv6 yet, `requests` use ipv6 by default
 # and wait for timeout before trying ipv4, so we have to disable ipv6
 requests.packages.urllib3.util.connection.HAS_IPV6 = False
 
-_weather_code_map = {}
-_locations_map = {}
-_wind_direction_map = {}
-_regions_map = {}
-_sea_regions_map = {}
-_warning_type_map = {}
-_warning_group_map = {}
-_warning_severity_map = {}
+_inflight_requests = SingleFlight()
+_background_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="weatheril-refresh")
+_background_refreshes = set()
+_background_refresh_lock = threading.Lock()
+
+# Indexed reference maps keyed by (language, dataset name), dataset names are the REFERENCE_DATA_URLS keys.
+# Each one is fetched and indexed once, however many threads ask for it at the same time.
+_reference_data = KeyedOnce()
+# Stop event of the running background refresher of the reference maps, None when not running
+_reference_refresh_stop = None
+_reference_refresh_lock = threading.Lock()
+
 
 def get_weather_description_by_code(language: str, code: int | None) -> str:
     """
     Get the weather description by the weather code
     """
-    global _weather_code_map
-    if not _weather_code_map:
-        _weather_code_map = _get_weather_codes(language)
+    weather_code_map = get_reference_map(language, "weather_codes")
     if not code:
         return "Nothing"
     code = int(code)
-    return _weather_code_map.get(code, "Nothing")
+    return weather_code_map.get(code, "Nothing")
 
 def _get_weather_codes(language) -> dict:
     """
@@ -39,12 +55,11 @@ def _get_weather_codes(language) -> dict:
     """
     try:
         url = WEATHER_CODES_URL.format(language=language)
-        data = fetch_data(url)
-        return {int(d["weather_code"]): d["desc"] for d in data["data"].values()}
+        return _index_weather_codes(get_cached_data(url))
     except Exception as e:
         logger.error("Error getting weather codes. " + str(e))
         logger.exception(e)
-        return HE_WEATHER_CODES if language == "he" else EN_WEATHER_CODES
+        return _fallback_reference_map(language, "weather_codes")
 
 
 def get_location_name_by_id(language: str, lid: str | int):
@@ -52,10 +67,7 @@ def get_location_name_by_id(language: str, lid: str | int):
     Converts location id to City name
     """
     lid = int(lid)
-    global _locations_map
-    if not _locations_map:
-        _locations_map = _get_locations_map(language)
-    location = _locations_map.get(lid)
+    location = get_reference_map(language, "locations_info").get(lid)
     return location["name"] if location else "Nothing"
 
 def get_location_info_by_id(language: str, lid: str | int):
@@ -63,10 +75,7 @@ def get_location_info_by_id(language: str, lid: str | int):
     Converts location id to City name
     """
     lid = int(lid)
-    global _locations_map
-    if not _locations_map:
-        _locations_map = _get_locations_map(language)
-    return _locations_map.get(int(lid))
+    return get_reference_map(language, "locations_info").get(lid)
 
 def _get_locations_map(language) -> dict:
     """
@@ -74,22 +83,18 @@ def _get_locations_map(language) -> dict:
     """
     try:
         url = LOCATIONS_INFO_URL.format(language=language)
-        data = fetch_data(url)
-        return {int(d["lid"]): d for d in data["data"].values()}
+        return _index_locations(get_cached_data(url))
     except Exception as e:
         logger.error("Error getting locations info.. " + str(e))
         logger.exception(e)
-        return HE_LOCATIONS if language == "he" else EN_LOCATIONS
+        return _fallback_reference_map(language, "locations_info")
 
 
 def get_wind_direction(language: str, direction_code: int) -> int:
     """
     Converts the wind direction code to azimuth
     """
-    global _wind_direction_map
-    if not _wind_direction_map:
-        _wind_direction_map = _get_wind_direction_map(language)
-    direction = _wind_direction_map.get(direction_code)
+    direction = get_reference_map(language, "wind_directions").get(direction_code)
     if not direction:
         return -1
     if isinstance(direction, int):
@@ -102,23 +107,20 @@ def _get_wind_direction_map(language) -> dict:
     """
     try:
         url = WIND_DIRECTIONS_URL.format(language=language)
-        data = fetch_data(url)
-        return {int(k): v for k, v in data["data"].items()}
+        return _index_wind_directions(get_cached_data(url))
     except Exception as e:
         logger.error("Error getting directions info.. " + str(e))
         logger.exception(e)
-        return HE_WIND_DIRECTIONS if language == "he" else EN_WIND_DIRECTIONS
+        return _fallback_reference_map(language, "wind_directions")
 
 def get_sea_region_by_id(language: str, region_id: int):
     """
     Get Region Information by Id
     """
-    global _sea_regions_map
-    if not _sea_regions_map:
-        _sea_regions_map = _get_sea_regions(language)
-    if not _sea_regions_map:
+    sea_regions_map = get_reference_map(language, "sea_regions")
+    if not sea_regions_map:
         return None
-    sea_region = _sea_regions_map.get(region_id)
+    sea_region = sea_regions_map.get(region_id)
     return sea_region
 
 
@@ -128,8 +130,7 @@ def _get_sea_regions(language) -> dict:
     """
     try:
         url = SEA_REGIONS_URL.format(language=language)
-        data = fetch_data(url)
-        return {int(v['rid']): v for v in data["data"].values()}
+        return _index_sea_regions(get_cached_data(url))
     except Exception as e:
         logger.error("Error getting directions info.. " + str(e))
         logger.exception(e)
@@ -140,12 +141,10 @@ def get_region_by_id(language: str, region_id: str) -> dict:
     """
     Get Region Information by Id
     """
-    global _regions_map
-    if not _regions_map:
-        _regions_map = _get_regions(language)
-    if not _regions_map:
+    regions_map = get_reference_map(language, "regions")
+    if not regions_map:
         return {}
-    region = _regions_map.get(region_id, {})
+    region = regions_map.get(region_id, {})
     return region
 
 
@@ -155,8 +154,7 @@ def _get_regions(language) -> dict | None:
     """
     try:
         url = REGIONS_URL.format(language=language)
-        data = fetch_data(url)
-        return {v["rid"]: v for v in data["data"]}
+        return _index_regions(get_cached_data(url))
     except Exception as e:
         logger.error("Error getting Regions info.. " + str(e))
         logger.exception(e)
@@ -169,69 +167,288 @@ def _get_warning_metadata(language) -> dict | None:
     """
     try:
         url = WARNINGS_METADTA_URL.format(language=language)
-        data = fetch_data(url)
-        return data["data"]
+        return get_cached_data(url)
     except Exception as e:
         logger.error("Error getting Warning Metadata... " + str(e))
         logger.exception(e)
         raise e
 
+
+def _get_warning_maps(language) -> tuple | None:
+    """
+    Get the warning type, group and severity maps from IMS
+    """
+    warning_metadata = _get_warning_metadata(language)
+    if warning_metadata is None:
+        return None
+    return _index_warning_metadata(warning_metadata)
+
 def get_warning_type_by_id(language: str, warning_type_id: int) -> dict:
     """
     Get the Warning Types by Id
     """
-    global _warning_type_map
-    global _warning_group_map
-    global _warning_severity_map
-    if not _warning_type_map:
-        _warning_metadata = _get_warning_metadata(language)
-        if _warning_metadata is None:
-            raise ValueError("Warning Type Map not found")
-
-        _warning_type_map = {int(v["warning_type_id"]): v for v in _warning_metadata["ims_warning_type"].values()}
-        _warning_group_map = {k: v for k,v in _warning_metadata["warning_groups"].items()}
-        _warning_severity_map = {int(v["severity_id"]): v for v in _warning_metadata["warning_severity"].values()}
-    if not _warning_type_map:
+    warning_maps = get_reference_map(language, "warnings_metadata")
+    if not warning_maps or not warning_maps[0]:
         raise ValueError("Warning Type Map not found")
-    return _warning_type_map.get(warning_type_id, {})
+    return warning_maps[0].get(warning_type_id, {})
 
 def get_warning_group_by_id(language: str, warning_group_id: str) -> dict:
     """
     Get the Warning Group by Id
     """
-    global _warning_type_map
-    global _warning_group_map
-    global _warning_severity_map
-    if not _warning_type_map:
-        _warning_metadata = _get_warning_metadata(language)
-        if _warning_metadata is None:
-            return {}
-
-        _warning_type_map = {int(v["warning_type_id"]): v for v in _warning_metadata["ims_warning_type"].values()}
-        _warning_group_map = {k: v for k,v in _warning_metadata["warning_groups"].items()}
-        _warning_severity_map = {int(v["severity_id"]): v for v in _warning_metadata["warning_severity"].values()}
-    if not _warning_type_map:
+    warning_maps = get_reference_map(language, "warnings_metadata")
+    if not warning_maps:
+        return {}
+    if not warning_maps[0]:
         raise ValueError("Warning Group Map not found")
-    return _warning_group_map.get(warning_group_id, {})
+    return warning_maps[1].get(warning_group_id, {})
 
 def get_warning_severity_by_id(language: str, warning_severity_id: int) -> dict:
     """
     Get the Warning Severity by Id
     """
-    global _warning_type_map
-    global _warning_group_map
-    global _warning_severity_map
-    if not _warning_type_map:
-        _warning_metadata = _get_warning_metadata(language)
-        if _warning_metadata is None:
-            return {}
-
-        _warning_type_map = {int(v["warning_type_id"]): v for v in _warning_metadata["ims_warning_type"].values()}
-        _warning_group_map = {k: v for k,v in _warning_metadata["warning_groups"].items()}
-        _warning_severity_map = {int(v["severity_id"]): v for v in _warning_metadata["warning_severity"].values()}
-    if not _warning_severity_map:
+    warning_maps = get_reference_map(language, "warnings_metadata")
+    if not warning_maps:
+        return {}
+    if not warning_maps[2]:
         raise ValueError("Warning Severity Map not found")
-    return _warning_severity_map.get(warning_severity_id, {})
+    return warning_maps[2].get(warning_severity_id, {})
+
+
+def _index_weather_codes(data: dict) -> dict:
+    return {int(d["weather_code"]): d["desc"] for d in data.values()}
+
+
+def _index_locations(data: dict) -> dict:
+    return {int(d["lid"]): d for d in data.values()}
+
+
+def _index_wind_directions(data: dict) -> dict:
+    return {int(k): v for k, v in data.items()}
+
+
+def _index_regions(data: dict) -> dict:
+    return {v["rid"]: v for v in data}
+
+
+def _index_sea_regions(data: dict) -> dict:
+    return {int(v['rid']): v for v in data.values()}
+
+
+def _index_warning_metadata(warning_metadata: dict) -> tuple:
+    warning_type_map = {int(v["warning_type_id"]): v for v in warning_metadata["ims_warning_type"].values()}
+    warning_group_map = {k: v for k, v in warning_metadata["warning_groups"].items()}
+    warning_severity_map = {int(v["severity_id"]): v for v in warning_metadata["warning_severity"].values()}
+    return warning_type_map, warning_group_map, warning_severity_map
+
+
+REFERENCE_DATA_URLS = {
+    "weather_codes": WEATHER_CODES_URL,
+    "locations_info": LOCATIONS_INFO_URL,
+    "wind_directions": WIND_DIRECTIONS_URL,
+    "regions": REGIONS_URL,
+    "sea_regions": SEA_REGIONS_URL,
+    "warnings_metadata": WARNINGS_METADTA_URL,
+}
+
+# Fetch (with fallback) and index a reference dataset for a language
+_REFERENCE_DATA_LOADERS = {
+    "weather_codes": _get_weather_codes,
+    "locations_info": _get_locations_map,
+    "wind_directions": _get_wind_direction_map,
+    "regions": _get_regions,
+    "sea_regions": _get_sea_regions,
+    "warnings_metadata": _get_warning_maps,
+}
+
+# Index an already fetched reference payload
+_REFERENCE_DATA_INDEXERS = {
+    "weather_codes": _index_weather_codes,
+    "locations_info": _index_locations,
+    "wind_directions": _index_wind_directions,
+    "regions": _index_regions,
+    "sea_regions": _index_sea_regions,
+    "warnings_metadata": _index_warning_metadata,
+}
+
+
+class ReferenceDataError(Exception):
+    pass
+
+
+def _fallback_reference_map(language: str, name: str):
+    """
+    The indexed map of the consts fallback tables used when IMS cannot be reached,
+    None for the reference data without a fallback table (regions, sea regions, warning metadata)
+    """
+    if name == "weather_codes":
+        return consts.HE_WEATHER_CODES if language == "he" else consts.EN_WEATHER_CODES
+    if name == "locations_info":
+        return _index_locations(consts.HE_LOCATIONS if language == "he" else consts.EN_LOCATIONS)
+    if name == "wind_directions":
+        # Ids to azimuths, like the map indexed from IMS
+        return consts.WIND_DIRECTIONS_IDS
+    return None
+
+
+def load_fallback_reference_data(language: str, name: str) -> bool:
+    """
+    Use the fallback table for a reference map that is not loaded, like the sync loaders do when IMS fails.
+    Reads the tables shipped with the package only, no request is made.
+    return: whether the map is loaded now, False when it has no fallback table
+    """
+    return bool(_reference_data.get((language, name), lambda: _fallback_reference_map(language, name)))
+
+
+def get_reference_map(language: str, name: str):
+    """
+    Get the indexed reference map of a language, fetching it from IMS on first use
+    parameters:
+        >>> language: he or en
+        >>> name: one of the REFERENCE_DATA_URLS keys
+    """
+    return _reference_data.get((language, name), lambda: _REFERENCE_DATA_LOADERS[name](language))
+
+
+def get_missing_reference_data(language: str, names) -> list:
+    """
+    Get the names (keys of REFERENCE_DATA_URLS) of the reference maps of the language that were not loaded yet
+    """
+    return [name for name in names if not _reference_data.peek((language, name))]
+
+
+def load_reference_data(language: str, name: str, data: dict):
+    """
+    Index an already fetched reference payload (e.g. fetched asynchronously) into the maps of the language
+    parameters:
+        >>> language: language of the payload
+        >>> name: one of the REFERENCE_DATA_URLS keys
+        >>> data: the "data" part of the json payload returned by IMS for that endpoint
+    """
+    if name not in _REFERENCE_DATA_INDEXERS:
+        raise ValueError(f"Unknown reference data: {name}")
+    _reference_data.set((language, name), _REFERENCE_DATA_INDEXERS[name](data))
+
+
+def ensure_reference_data(language: str, names=tuple(REFERENCE_DATA_URLS)):
+    """
+    Fetch and index the reference maps of the language (all of them by default) that were not loaded yet.
+    The endpoints are fetched concurrently, with the same fallbacks as the lazy getters.
+    Maps that fail to load are left empty and retried on next use.
+    """
+    warm_up((language,), names)
+
+
+def warm_up(languages=("he", "en"), names=tuple(REFERENCE_DATA_URLS), timeout: float | None = None) -> bool:
+    """
+    Fetch and index the reference maps of all the languages at once, every endpoint of every language concurrently,
+    so the first get_forecast / get_warnings do not stall fetching them one by one.
+    Use it as a readiness gate before a service accepts traffic:
+        >>> if not warm_up(("he", "en"), timeout=30):
+        >>>     raise SystemExit("IMS reference data not loaded")
+    parameters:
+        >>> languages: languages to load
+        >>> names: the reference maps to load, keys of REFERENCE_DATA_URLS. default is all of them
+        >>> timeout: seconds to wait, the loads still running then go on in the background. default waits for all
+    return: True when every map is loaded, from IMS or from the fallback tables when IMS could not be reached
+    """
+    missing = [(language, name) for language in languages for name in get_missing_reference_data(language, names)]
+    if missing:
+        executor = ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="weatheril-reference")
+        loads = {executor.submit(get_reference_map, language, name): (language, name) for language, name in missing}
+        executor.shutdown(wait=False)
+        done, _ = wait(loads, timeout)
+        for load in done:
+            if load.exception() is not None:
+                logger.error("Error loading " + loads[load][1] + " reference data. " + str(load.exception()))
+    ready = True
+    for language in languages:
+        not_loaded = get_missing_reference_data(language, names)
+        if not_loaded:
+            logger.warning("Reference data not loaded for " + language + ": " + ", ".join(not_loaded))
+            ready = False
+    return ready
+
+
+def clear_reference_data(language: str | None = None):
+    """
+    Forget the loaded reference maps of a language (all languages when None), they are fetched again on next use.
+    The memoized parsed objects go too, they hold names taken from the forgotten maps.
+    """
+    _reference_data.discard(None if language is None else lambda key: key[0] == language)
+    # Imported here, parsing imports utils
+    from weatheril.parsing import clear_parsed_cache
+    clear_parsed_cache()
+
+
+def refresh_reference_data(languages=None, names=tuple(REFERENCE_DATA_URLS)) -> bool:
+    """
+    Fetch the loaded reference maps again and swap in the ones that changed. Each new map is indexed aside
+    and replaces the old one in a single assignment, so readers never wait and see either the old map or the new one.
+    Maps IMS fails to return are kept as they are.
+    parameters:
+        >>> languages: languages to refresh. default is every language loaded so far
+        >>> names: the reference maps to refresh, keys of REFERENCE_DATA_URLS. default is all of them
+    return: True when a map changed
+    """
+    changed = False
+    for language, name in _reference_data.keys():
+        if name not in names or (languages is not None and language not in languages):
+            continue
+        url = REFERENCE_DATA_URLS[name].format(language=language)
+        try:
+            # Skips the freshness check of get_cached_data, still revalidating with a conditional request
+            data = _inflight_requests.do(url, lambda: _fetch_with_fallback(url, None, 0))
+            new_map = _REFERENCE_DATA_INDEXERS[name](data) if data else None
+        except Exception as e:
+            logger.error("Error refreshing " + name + " reference data. " + str(e))
+            continue
+        if not new_map or new_map == _reference_data.peek((language, name)):
+            continue
+        logger.debug("Reference data changed: " + url)
+        _reference_data.set((language, name), new_map)
+        changed = True
+    if changed:
+        # Parsed forecasts and warnings hold names taken from the old maps. Imported here, parsing imports utils.
+        from weatheril.parsing import clear_parsed_cache
+        clear_parsed_cache()
+    return changed
+
+
+def start_reference_data_refresh(interval_in_sec: float = REFERENCE_DATA_CACHE_EXPIRATION):
+    """
+    Refresh the loaded reference maps every interval_in_sec seconds in a background thread (see refresh_reference_data),
+    instead of keeping them for the life of the process. Replaces the refresher already running, if any.
+    parameters:
+        >>> interval_in_sec: seconds between refreshes. default is a day, like their cache expiration
+    """
+    global _reference_refresh_stop
+    stop = threading.Event()
+
+    def refresh_periodically():
+        while not stop.wait(interval_in_sec):
+            try:
+                refresh_reference_data()
+            except Exception as e:
+                logger.error("Error refreshing reference data. " + str(e))
+
+    with _reference_refresh_lock:
+        if _reference_refresh_stop is not None:
+            _reference_refresh_stop.set()
+        _reference_refresh_stop = stop
+        threading.Thread(target=refresh_periodically, name="weatheril-reference-refresh", daemon=True).start()
+
+
+def stop_reference_data_refresh():
+    """
+    Stop the background refresher started by start_reference_data_refresh
+    """
+    global _reference_refresh_stop
+    with _reference_refresh_lock:
+        if _reference_refresh_stop is not None:
+            _reference_refresh_stop.set()
+            _reference_refresh_stop = None
+
 
 def get_day_of_the_week(language: str, date: datetime):
     """
@@ -285,32 +502,223 @@ def get_value(
     return value
 
 
+def fetch_json(url: str) -> dict:
+    """
+    Get the Json data from ims website, raising on network, http or decoding errors
+    """
+    def fetch():
+        acquire_request_slot(url)
+        logger.debug("Getting data from: " + url)
+        response = get_transport().get(url, timeout=get_request_timeout())
+        record_response(url, response)
+        response.raise_for_status()
+        return json_backend.loads(response.content)
+
+    return call_with_retries(url, fetch)
+
+
 def fetch_data(url: str) -> dict:
     """
     Helper method to get the Json data from ims website
     """
     try:
-        logger.debug("Getting data from: " + url)
-        response = requests.get(url)
-        response = json.loads(response.text)
-        return response
+        return fetch_json(url)
     except Exception as e:
         logger.error("Error getting data. " + str(e))
         logger.exception(e)
         return dict()
 
 
-def get_data(current_data, url, last_fetch_time, cache_expiration_in_sec) -> dict:
-    if (
-        current_data
-        and (datetime.now() - last_fetch_time).total_seconds()
-        < cache_expiration_in_sec
-    ):
-        return current_data
+def get_cached_data(
+    url: str,
+    cache_expiration_in_sec: float | None = None,
+    stale_while_revalidate: bool = False,
+    max_staleness_in_sec: float = DEFAULT_MAX_STALENESS,
+) -> dict:
+    """
+    Get the "data" part of an IMS response from the shared cache, fetching it when missing or expired.
+    Raises on network, http or decoding errors.
+    parameters:
+        >>> url: the IMS url
+        >>> cache_expiration_in_sec: age after which the cached data is refreshed.
+                                     None uses the endpoint expiration (see cache_policy)
+        >>> stale_while_revalidate: return expired data at once and refresh it in the background,
+                                    as long as it is younger than max_staleness_in_sec
+        >>> max_staleness_in_sec: age after which expired data is no longer served and callers wait for IMS
+    """
+    min_retention = max_staleness_in_sec if stale_while_revalidate else 0
+    entry = get_response_cache().get(url)
+    if entry:
+        age = entry.age()
+        if age < entry_expiration(url, cache_expiration_in_sec, entry):
+            return entry.data
+        if stale_while_revalidate and age < max_staleness_in_sec:
+            _refresh_in_background(url, cache_expiration_in_sec, min_retention)
+            return entry.data
+    # Concurrent callers for the same url wait for a single request
+    return _inflight_requests.do(url, lambda: _fetch_with_fallback(url, cache_expiration_in_sec, min_retention))
+
+
+def _fetch_with_fallback(url: str, cache_expiration_in_sec: float | None, min_retention: float) -> dict:
+    """
+    Fetch the url with retries, unless it failed moments ago (negative cache) or its endpoint circuit is open.
+    When IMS is not called or fails, the last good data of the url is served while the cache still has it.
+    """
+    negative_result = get_negative_result(url)
+    if negative_result is not None:
+        error = negative_result[1]
+        if error is None:
+            return {}
+    elif not get_circuit_breaker(url).allow():
+        error = CircuitOpenError("Circuit open for " + endpoint_of(url) + ", not calling " + url)
+    else:
+        try:
+            data = call_with_retries(url, lambda: _fetch_and_cache(url, cache_expiration_in_sec, min_retention))
+        except Exception as e:
+            record_outcome(url, e)
+            error = e
+        else:
+            record_outcome(url, None)
+            if not data:
+                remember_negative_result(url, None)
+            return data
+
+    last_good = get_response_cache().get(url)
+    if last_good is not None and last_good.data:
+        logger.warning("Serving last good data of " + url + ". " + str(error))
+        return last_good.data
+    raise error
+
+
+def _fetch_and_cache(url: str, cache_expiration_in_sec: float | None, min_retention: float) -> dict:
+    """
+    Fetch the url, revalidating the cached entry (even an expired one) with a conditional request when possible
+    """
+    cache = get_response_cache()
+    previous = cache.get(url)
+    acquire_request_slot(url)
+    logger.debug("Getting data from: " + url)
+    response = get_transport().get(url, headers=conditional_request_headers(previous), timeout=get_request_timeout())
+    record_response(url, response)
+    if response.status_code == 304 and previous is not None:
+        logger.debug("Not modified: " + url)
+        entry = previous.revalidated(max_age_from_headers(response.headers))
+    else:
+        response.raise_for_status()
+        entry = cache_entry_from_response(url, previous, response.content, response.headers)
+    if entry.data:
+        cache.set(url, entry, cache_retention(url, entry, cache_expiration_in_sec, min_retention))
+    return entry.data
+
+
+def cache_entry_from_response(url: str, previous: CacheEntry | None, body: bytes, headers) -> CacheEntry:
+    """
+    Build the cache entry of a 200 response. IMS often sends the same payload again,
+    so when the body is byte-identical to the cached one its data object is kept instead of decoding the body,
+    and the model objects parsed from it are reused (see parsing.memoized_parse).
+    """
+    fingerprint = body_fingerprint(body)
+    fetched_at = time.time()
+    if previous is not None and previous.fingerprint == fingerprint:
+        logger.debug("Unchanged: " + url)
+        data, published_at, changed_at = previous.data, previous.published_at, previous.changed_at
+    else:
+        data = json_backend.loads(body).get("data", {})
+        published_at, changed_at = published_at_of(url, data), fetched_at
+        observe_publication(url, published_at)
+    return CacheEntry(
+        data,
+        fetched_at,
+        headers.get("ETag"),
+        headers.get("Last-Modified"),
+        max_age_from_headers(headers),
+        published_at,
+        body,
+        fingerprint,
+        changed_at,
+    )
+
+
+def conditional_request_headers(entry: CacheEntry | None) -> dict:
+    """
+    If-None-Match / If-Modified-Since headers built from the validators of a cached entry
+    """
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def cache_retention(url: str, entry: CacheEntry, cache_expiration_in_sec: float | None, min_retention: float) -> float:
+    """
+    How long the cache backend has to keep an entry. Expired entries are kept around to be served
+    while stale (min_retention), to send conditional requests when they have validators,
+    and to recognize an identical payload by its fingerprint.
+    """
+    retention = max(entry_expiration(url, cache_expiration_in_sec, entry), min_retention)
+    if entry.etag or entry.last_modified or entry.fingerprint:
+        return max(retention, CONDITIONAL_REQUEST_RETENTION)
+    return retention
+
+
+def _refresh_in_background(url: str, cache_expiration_in_sec: float | None, min_retention: float):
+    """
+    Schedule a refresh of the url on the background refresh pool, unless one is already pending
+    """
+    with _background_refresh_lock:
+        if url in _background_refreshes:
+            return
+        _background_refreshes.add(url)
+
+    def refresh():
+        try:
+            _inflight_requests.do(url, lambda: _fetch_with_fallback(url, cache_expiration_in_sec, min_retention))
+        except Exception as e:
+            logger.error("Error refreshing " + url + " in the background. " + str(e))
+        finally:
+            with _background_refresh_lock:
+                _background_refreshes.discard(url)
+
+    logger.debug("Serving stale data, refreshing in the background: " + url)
+    _background_refresh_executor.submit(refresh)
+
+
+def get_data(
+    url: str,
+    cache_expiration_in_sec: float | None = None,
+    stale_while_revalidate: bool = False,
+    max_staleness_in_sec: float = DEFAULT_MAX_STALENESS,
+) -> dict:
+    """
+    Same as get_cached_data, returning an empty dict on errors.
+    The former get_data(current_data, url, last_fetch_time, cache_expiration_in_sec) call is still served,
+    with a DeprecationWarning, see _get_data_legacy
+    """
+    if not isinstance(url, str):
+        warnings.warn(
+            "get_data(current_data, url, last_fetch_time, cache_expiration_in_sec) is deprecated, "
+            "use get_data(url, cache_expiration_in_sec)",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _get_data_legacy(url, cache_expiration_in_sec, stale_while_revalidate, max_staleness_in_sec)
     try:
-        logger.debug("Getting data from " + url)
-        return fetch_data(url).get("data", {})
+        return get_cached_data(url, cache_expiration_in_sec, stale_while_revalidate, max_staleness_in_sec)
     except Exception as e:
         logger.error("Error getting city portal data. " + str(e))
         logger.exception(e)
     return {}
+
+
+def _get_data_legacy(current_data: dict, url: str, last_fetch_time: datetime, cache_expiration_in_sec: float) -> dict:
+    """
+    The former get_data: current_data while it is younger than cache_expiration_in_sec, the data of url otherwise
+    (now through the shared response cache)
+    """
+    if current_data and (datetime.now() - last_fetch_time).total_seconds() < cache_expiration_in_sec:
+        return current_data
+    return get_data(url, cache_expiration_in_sec)
@@ -3,11 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from .consts import TIMEZONE
+from . import consts
 from .utils import get_warning_severity_by_id, get_warning_type_by_id, get_region_by_id, get_warning_group_by_id, get_location_info_by_id
 
 
-@dataclass
+@dataclass(frozen=True)
 class Warning:
     language: str
     location_id: int
@@ -23,12 +23,15 @@ class Warning:
     text: str
     text_full: str
     valid_from_unix: int
-    groups: list[int | str]
-    regions: list[int | str]
+    groups: tuple[int | str, ...]
+    regions: tuple[int | str, ...]
     region_name: str = field(init=False)
     severity: str = field(init=False)
     warning_type: str = field(init=False)
-
+    # The group and region ids groups and regions are resolved from, kept so that
+    # dataclasses.replace() resolves them again instead of looking up the names as ids
+    group_ids: tuple[int | str, ...] | None = field(default=None, repr=False)
+    region_ids: tuple[int | str, ...] | None = field(default=None, repr=False)
 
     def __post_init__(self):
         location_info = get_location_info_by_id(self.language, self.location_id)
@@ -37,17 +40,21 @@ class Warning:
 
         rid = location_info.get('rid')
         region = get_region_by_id(self.language, region_id="r-" + str(rid))
-        self.region_name = region.get("name", "")
+        object.__setattr__(self, "region_name", region.get("name", ""))
 
-        self.severity = get_warning_severity_by_id(self.language, self.severity_id).get("severity_name", "")
-        self.warning_type = get_warning_type_by_id(self.language, int(self.warning_type_id)).get("name", "")
-        self.sent = TIMEZONE.localize(datetime.strptime(self.sent, "%Y-%m-%d %H:%M:%S")) if isinstance(self.sent, str) else self.sent
-        self.valid_from = TIMEZONE.localize(datetime.strptime(self.valid_from, "%Y-%m-%d %H:%M:%S")) if isinstance(self.valid_from, str) else self.valid_from
-        self.valid_to = TIMEZONE.localize(datetime.strptime(self.valid_to, "%Y-%m-%d %H:%M:%S")) if isinstance(self.valid_to, str) else self.valid_to
+        object.__setattr__(self, "severity", get_warning_severity_by_id(self.language, self.severity_id).get("severity_name", ""))
+        object.__setattr__(self, "warning_type", get_warning_type_by_id(self.language, int(self.warning_type_id)).get("name", ""))
+        object.__setattr__(self, "sent", consts.TIMEZONE.localize(datetime.strptime(self.sent, "%Y-%m-%d %H:%M:%S")) if isinstance(self.sent, str) else self.sent)
+        object.__setattr__(self, "valid_from", consts.TIMEZONE.localize(datetime.strptime(self.valid_from, "%Y-%m-%d %H:%M:%S")) if isinstance(self.valid_from, str) else self.valid_from)
+        object.__setattr__(self, "valid_to", consts.TIMEZONE.localize(datetime.strptime(self.valid_to, "%Y-%m-%d %H:%M:%S")) if isinstance(self.valid_to, str) else self.valid_to)
 
-        self.groups = list(map(lambda gid: get_warning_group_by_id(self.language, "g-" + str(gid))["name"], self.groups))
+        if self.group_ids is None:
+            object.__setattr__(self, "group_ids", tuple(self.groups))
+        object.__setattr__(self, "groups", tuple(map(lambda gid: get_warning_group_by_id(self.language, "g-" + str(gid))["name"], self.group_ids)))
 
-        self.regions = list(map(lambda rid: get_region_by_id(self.language, "r-" + str(rid)).get("name", ""), self.regions))
+        if self.region_ids is None:
+            object.__setattr__(self, "region_ids", tuple(self.regions))
+        object.__setattr__(self, "regions", tuple(map(lambda rid: get_region_by_id(self.language, "r-" + str(rid)).get("name", ""), self.region_ids)))
 
         if not self.text_full:
-            self.text_full = self.full_en.strip() if self.language == "en" else self.full_he.strip()
+            object.__setattr__(self, "text_full", self.full_en.strip() if self.language == "en" else self.full_he.strip())
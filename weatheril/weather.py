@@ -11,7 +11,50 @@ from .utils import (
 )
 
 
-@dataclass
+class FrozenDict(dict):
+    """
+    dict that cannot be changed after it is built. Still a dict, so json.dumps() and isinstance checks work
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("FrozenDict is read-only, use Weather.json_dict() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _freeze(value):
+    """
+    Deep read-only copy of a json value: dicts become FrozenDicts and lists tuples
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """
+    Deep mutable copy of a frozen json value
+    """
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
 class Weather:
     language: str
     lid: str
@@ -33,7 +76,8 @@ class Weather:
     min_temp: Optional[int]
     max_temp: Optional[int]
     pm10: int
-    json: str
+    # Deep read-only copy of the analysis payload, the object is shared between callers
+    json: dict = field(compare=False)
     weather_code: Optional[int]
     wave_height: float
     location: str = field(init=False)
@@ -43,8 +87,16 @@ class Weather:
     modified_at: datetime
 
     def __post_init__(self):
-        self.location = get_location_name_by_id(self.language, self.lid)
-        self.description = get_weather_description_by_code(
-            self.language, self.weather_code
+        if not isinstance(self.json, FrozenDict):
+            object.__setattr__(self, "json", _freeze(self.json))
+        object.__setattr__(self, "location", get_location_name_by_id(self.language, self.lid))
+        object.__setattr__(
+            self, "description", get_weather_description_by_code(self.language, self.weather_code)
         )
-        self.wind_direction = get_wind_direction(self.language, self.wind_direction_id)
+        object.__setattr__(self, "wind_direction", get_wind_direction(self.language, self.wind_direction_id))
+
+    def json_dict(self) -> dict:
+        """
+        Mutable copy of the analysis payload, with plain dicts and lists
+        """
+        return _thaw(self.json)